@@ -15,10 +15,28 @@ Usage:
 """
 
 import requests
+import json
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 import sys
 
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+# Per-record output goes through logging so large runs can silence it,
+# e.g. LOGLEVEL=WARNING python3 basic_operations.py
+logging.basicConfig(
+    level=os.getenv("LOGLEVEL", "INFO").upper(),
+    format="%(message)s",
+    stream=sys.stdout
+)
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -33,6 +51,47 @@ if not API_KEY:
 
 headers = {"x-api-key": API_KEY, "Content-Type": "application/json"}
 
+# Number of requests main() keeps in flight at once
+CONCURRENCY = 4
+
+# One session for every call: urllib3 keeps the HTTPS connection alive
+# between requests instead of paying a new TCP + TLS handshake each time.
+# The pool holds one connection per concurrent request to the single API host.
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=CONCURRENCY, pool_block=True)
+)
+
+NEW_CONTACT = {
+    "name": "Alice Johnson",
+    "email": "alice@techstartup.com",
+    "phone": "+1-555-0100",
+    "company": "Tech Startup Inc",
+    "role": "CTO",
+    "location": "San Francisco, CA",
+    "notes": "Met at TechCrunch Disrupt 2024"
+}
+
+CONTACT_UPDATES = {
+    "role": "VP Engineering",
+    "notes": "Promoted to VP Engineering in Q1 2024"
+}
+
+NEW_DEAL = {
+    "title": "Enterprise License - Tech Startup Inc",
+    "value": 75000,
+    "stage": "Proposal Sent",
+    "priority": "High",
+    "notes": "Annual contract, 50 seats"
+}
+
+DEAL_UPDATES = {
+    "stage": "Negotiation",
+    "notes": "Contract review in progress, legal approval pending"
+}
+
 
 def print_separator(title):
     """Print a formatted section separator."""
@@ -41,39 +100,36 @@ def print_separator(title):
     print(f"{'='*60}\n")
 
 
-def test_health():
-    """Test API health check."""
+def encode_json(payload):
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def test_health(response):
+    """Show the API health check."""
     print_separator("1. Health Check")
 
-    response = requests.get(f"{BASE_URL}/api/health")
-    health = response.json()
+    health = decode_json(response)
 
     print(f"Status: {health['status']}")
     print(f"Platform: {health['platform']}")
 
 
-def create_contact():
-    """Create a new contact."""
+def create_contact(response):
+    """Show the newly created contact."""
     print_separator("2. Create Contact")
 
-    new_contact = {
-        "name": "Alice Johnson",
-        "email": "alice@techstartup.com",
-        "phone": "+1-555-0100",
-        "company": "Tech Startup Inc",
-        "role": "CTO",
-        "location": "San Francisco, CA",
-        "notes": "Met at TechCrunch Disrupt 2024"
-    }
-
-    response = requests.post(
-        f"{BASE_URL}/api/contacts",
-        headers=headers,
-        json=new_contact
-    )
-
     if response.status_code == 201:
-        result = response.json()
+        result = decode_json(response)
         contact = result.get("created", [{}])[0]
         print(f"✅ Created contact: {contact['name']}")
         print(f"   ID: {contact['id']}")
@@ -85,22 +141,23 @@ def create_contact():
         return None
 
 
-def list_contacts():
-    """List all contacts."""
+def list_contacts(response):
+    """Show all contacts."""
     print_separator("3. List All Contacts")
 
-    response = requests.get(f"{BASE_URL}/api/contacts", headers=headers)
-
     if response.status_code == 200:
-        contacts = response.json()
+        contacts = decode_json(response)
         print(f"Found {len(contacts)} contact(s):\n")
 
-        for contact in contacts:
-            print(f"📇 {contact['name']}")
-            print(f"   Email: {contact.get('email', 'N/A')}")
-            print(f"   Company: {contact.get('company', 'N/A')}")
-            print(f"   Role: {contact.get('role', 'N/A')}")
-            print()
+        if logger.isEnabledFor(logging.INFO):
+            for contact in contacts:
+                logger.info(
+                    "📇 %s\n   Email: %s\n   Company: %s\n   Role: %s\n",
+                    contact['name'],
+                    contact.get('email', 'N/A'),
+                    contact.get('company', 'N/A'),
+                    contact.get('role', 'N/A')
+                )
 
         return contacts
     else:
@@ -108,23 +165,12 @@ def list_contacts():
         return []
 
 
-def update_contact(contact_id):
-    """Update a contact."""
+def update_contact(response):
+    """Show the updated contact."""
     print_separator("4. Update Contact")
 
-    updates = {
-        "role": "VP Engineering",
-        "notes": "Promoted to VP Engineering in Q1 2024"
-    }
-
-    response = requests.patch(
-        f"{BASE_URL}/api/contacts/{contact_id}",
-        headers=headers,
-        json=updates
-    )
-
     if response.status_code == 200:
-        updated = response.json()
+        updated = decode_json(response)
         print(f"✅ Updated contact: {updated['name']}")
         print(f"   New Role: {updated['role']}")
         print(f"   Notes: {updated['notes']}")
@@ -132,27 +178,12 @@ def update_contact(contact_id):
         print(f"❌ Failed to update contact: {response.text}")
 
 
-def create_deal(contact_id):
-    """Create a new deal."""
+def create_deal(response):
+    """Show the newly created deal."""
     print_separator("5. Create Deal")
 
-    new_deal = {
-        "title": "Enterprise License - Tech Startup Inc",
-        "value": 75000,
-        "stage": "Proposal Sent",
-        "priority": "High",
-        "contact_id": contact_id,
-        "notes": "Annual contract, 50 seats"
-    }
-
-    response = requests.post(
-        f"{BASE_URL}/api/deals",
-        headers=headers,
-        json=new_deal
-    )
-
     if response.status_code == 201:
-        result = response.json()
+        result = decode_json(response)
         deal = result.get("created", [{}])[0]
         print(f"✅ Created deal: {deal['title']}")
         print(f"   ID: {deal['id']}")
@@ -165,23 +196,12 @@ def create_deal(contact_id):
         return None
 
 
-def update_deal_stage(deal_id):
-    """Update a deal's stage."""
+def update_deal_stage(response):
+    """Show the deal after its stage update."""
     print_separator("6. Update Deal Stage")
 
-    updates = {
-        "stage": "Negotiation",
-        "notes": "Contract review in progress, legal approval pending"
-    }
-
-    response = requests.patch(
-        f"{BASE_URL}/api/deals/{deal_id}",
-        headers=headers,
-        json=updates
-    )
-
     if response.status_code == 200:
-        updated = response.json()
+        updated = decode_json(response)
         print(f"✅ Updated deal: {updated['title']}")
         print(f"   New Stage: {updated['stage']}")
         print(f"   Notes: {updated['notes']}")
@@ -189,22 +209,23 @@ def update_deal_stage(deal_id):
         print(f"❌ Failed to update deal: {response.text}")
 
 
-def list_deals():
-    """List all deals."""
+def list_deals(response):
+    """Show all deals."""
     print_separator("7. List All Deals")
 
-    response = requests.get(f"{BASE_URL}/api/deals", headers=headers)
-
     if response.status_code == 200:
-        deals = response.json()
+        deals = decode_json(response)
         print(f"Found {len(deals)} deal(s):\n")
 
-        for deal in deals:
-            print(f"💼 {deal['title']}")
-            print(f"   Value: ${deal.get('value', 0):,}")
-            print(f"   Stage: {deal['stage']}")
-            print(f"   Priority: {deal.get('priority', 'N/A')}")
-            print()
+        if logger.isEnabledFor(logging.INFO):
+            for deal in deals:
+                logger.info(
+                    "💼 %s\n   Value: $%s\n   Stage: %s\n   Priority: %s\n",
+                    deal['title'],
+                    f"{deal.get('value', 0):,}",
+                    deal['stage'],
+                    deal.get('priority', 'N/A')
+                )
 
         return deals
     else:
@@ -212,33 +233,23 @@ def list_deals():
         return []
 
 
-def delete_contact(contact_id):
-    """Delete a contact."""
+def delete_contact(response):
+    """Show the result of deleting a contact."""
     print_separator("8. Delete Contact")
 
-    response = requests.delete(
-        f"{BASE_URL}/api/contacts/{contact_id}",
-        headers=headers
-    )
-
     if response.status_code == 200:
-        result = response.json()
+        result = decode_json(response)
         print(f"✅ {result['message']}")
     else:
         print(f"❌ Failed to delete contact: {response.text}")
 
 
-def delete_deal(deal_id):
-    """Delete a deal."""
+def delete_deal(response):
+    """Show the result of deleting a deal."""
     print_separator("9. Delete Deal")
 
-    response = requests.delete(
-        f"{BASE_URL}/api/deals/{deal_id}",
-        headers=headers
-    )
-
     if response.status_code == 200:
-        result = response.json()
+        result = decode_json(response)
         print(f"✅ {result['message']}")
     else:
         print(f"❌ Failed to delete deal: {response.text}")
@@ -249,38 +260,56 @@ def main():
     print("\n🚀 Zero CRM API - Basic Operations Example")
 
     try:
-        # 1. Health check
-        test_health()
-
-        # 2. Create a contact
-        contact_id = create_contact()
-        if not contact_id:
-            print("❌ Stopping due to contact creation failure")
-            return
-
-        # 3. List contacts
-        list_contacts()
-
-        # 4. Update the contact
-        update_contact(contact_id)
-
-        # 5. Create a deal
-        deal_id = create_deal(contact_id)
-        if not deal_id:
-            print("❌ Stopping due to deal creation failure")
-            return
+        # Independent requests are submitted together so their round trips
+        # overlap; results are still printed in step order
+        with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+            # 1-2. The health check does not depend on the new contact
+            health = executor.submit(SESSION.get, f"{BASE_URL}/api/health")
+            created_contact = executor.submit(
+                SESSION.post,
+                f"{BASE_URL}/api/contacts",
+                data=encode_json(NEW_CONTACT)
+            )
+
+            test_health(health.result())
+            contact_id = create_contact(created_contact.result())
+            if not contact_id:
+                print("❌ Stopping due to contact creation failure")
+                return
+
+            # 3-5. Listing, updating and attaching a deal only need the contact ID
+            contacts = executor.submit(SESSION.get, f"{BASE_URL}/api/contacts")
+            updated_contact = executor.submit(
+                SESSION.patch,
+                f"{BASE_URL}/api/contacts/{contact_id}",
+                data=encode_json(CONTACT_UPDATES)
+            )
+            created_deal = executor.submit(
+                SESSION.post,
+                f"{BASE_URL}/api/deals",
+                data=encode_json({**NEW_DEAL, "contact_id": contact_id})
+            )
+
+            list_contacts(contacts.result())
+            update_contact(updated_contact.result())
+            deal_id = create_deal(created_deal.result())
+            if not deal_id:
+                print("❌ Stopping due to deal creation failure")
+                return
 
         # 6. Update deal stage
-        update_deal_stage(deal_id)
+        update_deal_stage(
+            SESSION.patch(f"{BASE_URL}/api/deals/{deal_id}", data=encode_json(DEAL_UPDATES))
+        )
 
-        # 7. List deals
-        list_deals()
+        # 7. List deals (after the update so the new stage shows up)
+        list_deals(SESSION.get(f"{BASE_URL}/api/deals"))
 
         # 8. Cleanup: Delete deal
-        delete_deal(deal_id)
+        delete_deal(SESSION.delete(f"{BASE_URL}/api/deals/{deal_id}"))
 
         # 9. Cleanup: Delete contact
-        delete_contact(contact_id)
+        delete_contact(SESSION.delete(f"{BASE_URL}/api/contacts/{contact_id}"))
 
         print_separator("✅ All Operations Completed Successfully")
 
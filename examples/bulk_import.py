@@ -14,10 +14,34 @@ Usage:
 """
 
 import requests
+import json
+import logging
 import os
 import csv
+import hashlib
 import sys
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+# Per-record output goes through logging so large runs can silence it,
+# e.g. LOGLEVEL=WARNING python3 bulk_import.py contacts.csv
+logging.basicConfig(
+    level=os.getenv("LOGLEVEL", "INFO").upper(),
+    format="%(message)s",
+    stream=sys.stdout
+)
+logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
@@ -31,6 +55,24 @@ if not API_KEY:
 
 headers = {"x-api-key": API_KEY, "Content-Type": "application/json"}
 
+# Large imports are split into chunks, a few of them posted concurrently
+CHUNK_SIZE = 200
+MAX_PARALLEL_CHUNKS = 4
+TIMEOUT = (2, 10)  # (connect, read) seconds
+
+# CSV columns copied into each record (empty values are left out)
+CONTACT_FIELDS = ("name", "email", "phone", "company", "role", "location", "notes")
+DEAL_TEXT_FIELDS = ("title", "stage", "priority", "notes")
+
+# Reuse one keep-alive connection pool for all imports, sized so every
+# in-flight chunk gets its own connection and none are discarded
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=MAX_PARALLEL_CHUNKS, pool_block=True)
+)
+
 
 def print_separator(title):
     """Print a formatted section separator."""
@@ -39,115 +81,301 @@ def print_separator(title):
     print(f"{'='*60}\n")
 
 
+def encode_json(payload):
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def row_digest(data):
+    """Return a 16-byte fingerprint of a row key, for duplicate checks."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
 def read_contacts_csv(filename):
-    """Read contacts from CSV file."""
-    contacts = []
+    """
+    Yield contacts from a CSV file one row at a time.
 
-    if not os.path.exists(filename):
-        print(f"❌ File not found: {filename}")
-        return contacts
+    Rows repeating an earlier contact (same email, or same name when there
+    is no email) are skipped so they are never sent. Only a digest of each
+    key is kept, but that still costs memory per distinct contact
+    (O(distinct rows), about 100 bytes each).
+    """
+    seen = set()
 
-    with open(filename, 'r', encoding='utf-8') as f:
+    with open(filename, 'r', newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
 
         for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is 1)
-            # Required field validation
-            if not row.get("name"):
-                print(f"⚠️  Skipping row {row_num}: Missing required field 'name'")
+            # Copy only non-empty fields so each row builds a single dict
+            contact = {}
+            for field in CONTACT_FIELDS:
+                text = (row.get(field) or "").strip()
+                if text:
+                    contact[field] = text
+
+            # Required field validation (after stripping, so a blank name
+            # made of spaces counts as missing)
+            if "name" not in contact:
+                logger.warning("⚠️  Skipping row %d: Missing required field 'name'", row_num)
                 continue
 
-            contact = {
-                "name": row["name"].strip(),
-                "email": row.get("email", "").strip(),
-                "phone": row.get("phone", "").strip(),
-                "company": row.get("company", "").strip(),
-                "role": row.get("role", "").strip(),
-                "location": row.get("location", "").strip(),
-                "notes": row.get("notes", "").strip()
-            }
-
-            # Remove empty fields
-            contact = {k: v for k, v in contact.items() if v}
-            contacts.append(contact)
+            key = contact.get("email") or contact["name"]
+            digest = row_digest(key.encode('utf-8'))
+            if digest in seen:
+                logger.warning("⚠️  Skipping row %d: Duplicate contact '%s'", row_num, key)
+                continue
+            seen.add(digest)
 
-    return contacts
+            yield contact
 
 
 def read_deals_csv(filename):
-    """Read deals from CSV file."""
-    deals = []
+    """
+    Yield deals from a CSV file one row at a time, as encoded JSON bytes.
+
+    Each deal is encoded once, for the duplicate check, and those bytes
+    are what gets posted.
 
-    if not os.path.exists(filename):
-        print(f"❌ File not found: {filename}")
-        return deals
+    Rows identical to an earlier row are skipped so they are never sent.
+    Only a digest of each row is kept, not its values, but that still
+    costs memory per distinct deal (O(distinct rows), about 100 bytes each).
+    """
+    seen = set()
 
-    with open(filename, 'r', encoding='utf-8') as f:
+    with open(filename, 'r', newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
 
         for row_num, row in enumerate(reader, start=2):
             # Required field validation
             if not row.get("title"):
-                print(f"⚠️  Skipping row {row_num}: Missing required field 'title'")
+                logger.warning("⚠️  Skipping row %d: Missing required field 'title'", row_num)
                 continue
 
             if not row.get("stage"):
-                print(f"⚠️  Skipping row {row_num}: Missing required field 'stage'")
+                logger.warning("⚠️  Skipping row %d: Missing required field 'stage'", row_num)
                 continue
 
-            deal = {
-                "title": row["title"].strip(),
-                "stage": row["stage"].strip(),
-                "value": float(row.get("value", 0)) if row.get("value") else 0,
-                "priority": row.get("priority", "").strip(),
-                "notes": row.get("notes", "").strip()
-            }
-
-            # Remove empty fields
-            deal = {k: v for k, v in deal.items() if v}
-            deals.append(deal)
+            # Copy only non-empty fields so each row builds a single dict
+            deal = {}
+            for field in DEAL_TEXT_FIELDS:
+                text = (row.get(field) or "").strip()
+                if text:
+                    deal[field] = text
+
+            try:
+                value = float(row["value"]) if row.get("value") else 0
+            except ValueError:
+                logger.warning("⚠️  Skipping row %d: Invalid value '%s'", row_num, row["value"])
+                continue
+            if value:
+                deal["value"] = value
+
+            # Fields are always added in the same order, so equal rows
+            # encode to the same bytes
+            encoded = encode_json(deal)
+            digest = row_digest(encoded)
+            if digest in seen:
+                logger.warning("⚠️  Skipping row %d: Duplicate of an earlier row", row_num)
+                continue
+            seen.add(digest)
+
+            yield encoded
+
+
+def encode_record(record):
+    """Encode a record for a chunk body; records already encoded pass through."""
+    if isinstance(record, bytes):
+        return record
+    return encode_json(record)
+
+
+def make_poster(endpoint):
+    """
+    Build a function that POSTs one chunk of pre-encoded JSON records.
+
+    The session method, URL and timeout are resolved once per import and
+    captured by the closure, rather than looked up again for every chunk.
+    """
+    post = SESSION.post
+    url = f"{BASE_URL}{endpoint}"
+    timeout = TIMEOUT
+
+    def post_chunk(chunk):
+        return post(url, data=b"[" + b",".join(chunk) + b"]", timeout=timeout)
+
+    return post_chunk
+
+
+def iter_chunks(records, size):
+    """Group an iterable of records into lists of at most `size` items."""
+    records = iter(records)
+    chunk = list(islice(records, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(records, size))
+
+
+def read_ahead(records, transform, maxsize=2 * CHUNK_SIZE):
+    """
+    Iterate over transform(record) for records produced by a background thread.
+
+    Parsing keeps going while the importer waits on the network, and at
+    most `maxsize` parsed records are buffered. Errors raised while
+    producing (e.g. a missing file) are re-raised in the consumer. If the
+    consumer stops early (an error, Ctrl-C, or the generator being
+    closed), the producer thread exits and closes its source.
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    end = object()
+    stop = threading.Event()
+
+    def put(item):
+        # Poll the stop flag so a full buffer never blocks the thread forever
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for record in records:
+                if not put(transform(record)):
+                    return
+            put(end)
+        except Exception as e:
+            put(e)
+        finally:
+            close = getattr(records, "close", None)
+            if close is not None:
+                close()  # e.g. a CSV reader generator closes its file
+
+    threading.Thread(target=produce, daemon=True).start()
 
-    return deals
+    try:
+        while True:
+            item = buffer.get()
+            if item is end:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def post_in_chunks(endpoint, records):
+    """
+    POST records in fixed-size chunks, several chunks in flight at once.
+
+    Records are read ahead on a background thread and consumed lazily, so
+    parsing overlaps with the uploads and only a bounded number of records
+    is buffered at a time, however large the source is. (The CSV readers'
+    duplicate checks still grow with the number of distinct rows.)
+
+    Returns:
+        (total, created, skipped, failed) where total is the number of
+        records sent and failed lists the numbers of the chunks that failed
+    """
+    total = 0
+    created = []
+    skipped = []
+    failed = []
+    in_flight = deque()
+    post_chunk = make_poster(endpoint)
+    add_created = created.extend
+    add_skipped = skipped.extend
+
+    def collect(chunk_num, future):
+        try:
+            response = future.result()
+        except RequestException as e:
+            print(f"❌ Chunk {chunk_num} failed: {e}")
+            failed.append(chunk_num)
+            return
+
+        if response.status_code != 201:
+            print(f"❌ Chunk {chunk_num} failed: {response.status_code}")
+            print(f"   Response: {response.text}")
+            failed.append(chunk_num)
+            return
+
+        result = decode_json(response)
+        add_created(result.get("created", []))
+        add_skipped(result.get("skipped", []))
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_CHUNKS) as executor:
+        # Each record is encoded once (by the reader or on the read-ahead
+        # thread); chunk bodies are then just joined bytes
+        encoded = read_ahead(records, encode_record)
+        chunks = iter_chunks(encoded, CHUNK_SIZE)
+        completed = False
+
+        try:
+            for chunk_num, chunk in enumerate(chunks, start=1):
+                total += len(chunk)
+                in_flight.append((chunk_num, executor.submit(post_chunk, chunk)))
+
+                # Wait for the oldest chunk before reading further ahead
+                if len(in_flight) >= MAX_PARALLEL_CHUNKS:
+                    collect(*in_flight.popleft())
+            completed = True
+        finally:
+            # Chunks already sent still land on the server, so collect them
+            # even when the import stops early and say how far it got
+            encoded.close()  # Stops the read-ahead thread if it is still running
+            while in_flight:
+                collect(*in_flight.popleft())
+            # Only once something was sent; a missing file fails before that
+            if not completed and total:
+                print(f"⚠️  Import stopped early: {len(created)} record(s) were created before the failure")
+
+    return total, created, skipped, failed
 
 
 def bulk_import_contacts(contacts):
-    """Import contacts in bulk."""
-    print_separator(f"Importing {len(contacts)} Contacts")
-
-    if not contacts:
-        print("⚠️  No contacts to import")
-        return
-
+    """Import contacts in bulk from an iterable of records."""
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/contacts",
-            headers=headers,
-            json=contacts
-        )
+        total, created, skipped, failed = post_in_chunks("/api/contacts", contacts)
 
-        if response.status_code == 201:
-            result = response.json()
-            created = result.get("created", [])
-            skipped = result.get("skipped", [])
+        if not total:
+            print("⚠️  No contacts to import")
+            return []
 
+        if failed:
+            print(f"⚠️  Imported {len(created)} contact(s); {len(failed)} chunk(s) failed (see above)")
+        else:
             print(f"✅ Successfully imported {len(created)} contact(s)")
 
-            if skipped:
-                print(f"⚠️  Skipped {len(skipped)} contact(s)")
+        if skipped:
+            print(f"⚠️  Skipped {len(skipped)} contact(s)")
 
-            # Show sample of created contacts
-            if created:
-                print("\n📇 Sample of created contacts:")
+        # Show sample of created contacts
+        if created:
+            print("\n📇 Sample of created contacts:")
+            if logger.isEnabledFor(logging.INFO):
                 for contact in created[:3]:  # Show first 3
-                    print(f"   • {contact['name']} ({contact.get('email', 'No email')})")
+                    logger.info("   • %s (%s)", contact['name'], contact.get('email', 'No email'))
 
-                if len(created) > 3:
-                    print(f"   ... and {len(created) - 3} more")
+            if len(created) > 3:
+                print(f"   ... and {len(created) - 3} more")
 
-            return created
-        else:
-            print(f"❌ Import failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return []
+        return created
+
+    except FileNotFoundError as e:
+        print(f"❌ File not found: {e.filename}")
+        return []
 
     except Exception as e:
         print(f"❌ Error during import: {e}")
@@ -155,53 +383,46 @@ def bulk_import_contacts(contacts):
 
 
 def bulk_import_deals(deals):
-    """Import deals in bulk."""
-    print_separator(f"Importing {len(deals)} Deals")
-
-    if not deals:
-        print("⚠️  No deals to import")
-        return
-
+    """Import deals in bulk from an iterable of records (dicts or encoded JSON bytes)."""
     try:
-        response = requests.post(
-            f"{BASE_URL}/api/deals",
-            headers=headers,
-            json=deals
-        )
+        total, created, skipped, failed = post_in_chunks("/api/deals", deals)
 
-        if response.status_code == 201:
-            result = response.json()
-            created = result.get("created", [])
-            skipped = result.get("skipped", [])
+        if not total:
+            print("⚠️  No deals to import")
+            return []
 
+        if failed:
+            print(f"⚠️  Imported {len(created)} deal(s); {len(failed)} chunk(s) failed (see above)")
+        else:
             print(f"✅ Successfully imported {len(created)} deal(s)")
 
-            if skipped:
-                print(f"⚠️  Skipped {len(skipped)} deal(s)")
+        if skipped:
+            print(f"⚠️  Skipped {len(skipped)} deal(s)")
 
-            # Show sample of created deals
-            if created:
-                print("\n💼 Sample of created deals:")
-                total_value = 0
+        # Show sample of created deals
+        if created:
+            print("\n💼 Sample of created deals:")
+            if logger.isEnabledFor(logging.INFO):
                 for deal in created[:3]:  # Show first 3
-                    value = deal.get('value', 0)
-                    total_value += value
-                    print(f"   • {deal['title']} - ${value:,} ({deal['stage']})")
+                    logger.info(
+                        "   • %s - $%s (%s)",
+                        deal['title'],
+                        f"{deal.get('value', 0):,}",
+                        deal['stage']
+                    )
 
-                if len(created) > 3:
-                    print(f"   ... and {len(created) - 3} more")
+            if len(created) > 3:
+                print(f"   ... and {len(created) - 3} more")
 
-                # Calculate total value
-                for deal in created[3:]:
-                    total_value += deal.get('value', 0)
+            # Calculate total value across every created deal
+            total_value = sum(deal.get('value', 0) for deal in created)
+            print(f"\n💰 Total pipeline value: ${total_value:,}")
 
-                print(f"\n💰 Total pipeline value: ${total_value:,}")
+        return created
 
-            return created
-        else:
-            print(f"❌ Import failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return []
+    except FileNotFoundError as e:
+        print(f"❌ File not found: {e.filename}")
+        return []
 
     except Exception as e:
         print(f"❌ Error during import: {e}")
@@ -306,27 +527,19 @@ def main():
         print(f"   python3 {sys.argv[0]} {contacts_file} {deals_file}")
         print("\nProceeding with sample files...\n")
 
-    # Import contacts
+    # Import contacts (streamed from the CSV, never fully loaded)
     if contacts_file:
-        print_separator(f"Reading Contacts from {contacts_file}")
-        contacts = read_contacts_csv(contacts_file)
-        print(f"Found {len(contacts)} valid contact(s)")
-
-        if contacts:
-            bulk_import_contacts(contacts)
+        print_separator(f"Importing Contacts from {contacts_file}")
+        bulk_import_contacts(read_contacts_csv(contacts_file))
 
     # Import deals
     if deals_file:
-        print_separator(f"Reading Deals from {deals_file}")
-        deals = read_deals_csv(deals_file)
-        print(f"Found {len(deals)} valid deal(s)")
-
-        if deals:
-            bulk_import_deals(deals)
+        print_separator(f"Importing Deals from {deals_file}")
+        bulk_import_deals(read_deals_csv(deals_file))
 
     print_separator("✅ Bulk Import Completed")
     print("\n💡 Tips:")
-    print("   • Use bulk import for batches of 10-1000 records")
+    print(f"   • Large files are sent in chunks of {CHUNK_SIZE} records")
     print("   • Validate CSV data before import")
     print("   • Check the 'skipped' array for failed imports")
 
@@ -14,12 +14,21 @@ Usage:
 """
 
 import requests
+import json
 import os
+import re
 import sys
-import time
 import logging
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
+from urllib3.exceptions import ReadTimeoutError
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -40,16 +49,61 @@ if not API_KEY:
 
 headers = {"x-api-key": API_KEY, "Content-Type": "application/json"}
 
+# Retry server errors, connection errors and timeouts with exponential
+# backoff inside the connection pool: urllib3 retries the first failure
+# at once, then waits 4s and 8s. The final 5xx response is returned
+# rather than raised so callers see a normal HTTPError.
+MAX_RETRIES = 3
+RETRY = Retry(
+    total=MAX_RETRIES,
+    backoff_factor=2,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'POST', 'PATCH', 'DELETE']),
+    raise_on_status=False
+)
+
+TIMEOUT = (2, 10)  # (connect, read) seconds
+
+# Retries and follow-up calls reuse the same keep-alive connection; requests
+# are made one at a time, so a single pooled connection is enough
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(max_retries=RETRY, pool_connections=1, pool_maxsize=1)
+)
+
+# Validation rules, built once instead of on every validate_* call
+PRIORITIES = ('Low', 'Medium', 'High')
+VALID_PRIORITIES = frozenset(PRIORITIES)
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
 
-def make_request_with_retry(method, endpoint, max_retries=3, backoff_factor=2, **kwargs):
+
+def encode_json(payload):
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def make_request_with_retry(method, endpoint, **kwargs):
     """
     Make API request with exponential backoff retry logic.
 
+    Retries are handled by the urllib3 Retry policy mounted on SESSION:
+    server errors, connection errors and timeouts are retried inside the
+    connection pool, while client errors (400/401/404) fail immediately.
+
     Args:
         method: HTTP method (GET, POST, PATCH, DELETE)
         endpoint: API endpoint path
-        max_retries: Maximum number of retry attempts
-        backoff_factor: Multiplier for exponential backoff
         **kwargs: Additional arguments for requests
 
     Returns:
@@ -57,78 +111,64 @@ def make_request_with_retry(method, endpoint, max_retries=3, backoff_factor=2, *
     """
     url = f"{BASE_URL}{endpoint}"
 
-    for attempt in range(max_retries):
-        try:
-            logger.info(f"{method} {endpoint} (attempt {attempt + 1}/{max_retries})")
-
-            response = requests.request(
-                method,
-                url,
-                headers=headers,
-                timeout=10,  # 10 second timeout
-                **kwargs
-            )
-
-            # Raise exception for 4xx/5xx status codes
-            response.raise_for_status()
-
-            logger.info(f"✅ Success: {method} {endpoint} - {response.status_code}")
-            return response.json()
-
-        except HTTPError as e:
-            status_code = e.response.status_code
-
-            if status_code == 401:
-                logger.error("❌ Authentication failed - Invalid API key")
-                logger.error("   Check your ZERO_CRM_API_KEY environment variable")
-                return None  # Don't retry authentication errors
-
-            elif status_code == 404:
-                logger.error(f"❌ Resource not found: {endpoint}")
-                return None  # Don't retry 404s
-
-            elif status_code == 400:
-                logger.error(f"❌ Bad request: {e.response.text}")
-                return None  # Don't retry validation errors
-
-            elif status_code >= 500:
-                # Server errors - retry with backoff
-                if attempt < max_retries - 1:
-                    wait_time = backoff_factor ** attempt
-                    logger.warning(f"⚠️  Server error {status_code} - retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"❌ Server error {status_code} after {max_retries} attempts")
-                    return None
-            else:
-                logger.error(f"❌ HTTP error {status_code}: {e.response.text}")
-                return None
-
-        except ConnectionError:
-            if attempt < max_retries - 1:
-                wait_time = backoff_factor ** attempt
-                logger.warning(f"⚠️  Connection error - retrying in {wait_time}s...")
-                time.sleep(wait_time)
-            else:
-                logger.error(f"❌ Connection failed after {max_retries} attempts")
-                return None
-
-        except Timeout:
-            if attempt < max_retries - 1:
-                wait_time = backoff_factor ** attempt
-                logger.warning(f"⚠️  Request timeout - retrying in {wait_time}s...")
-                time.sleep(wait_time)
-            else:
-                logger.error(f"❌ Request timed out after {max_retries} attempts")
-                return None
-
-        except RequestException as e:
-            logger.error(f"❌ Request error: {e}")
-            return None
+    try:
+        logger.info(f"{method} {endpoint}")
+
+        response = SESSION.request(
+            method,
+            url,
+            timeout=TIMEOUT,
+            **kwargs
+        )
+
+        # Raise exception for 4xx/5xx status codes
+        response.raise_for_status()
+
+        logger.info(f"✅ Success: {method} {endpoint} - {response.status_code}")
+        return decode_json(response)
+
+    except HTTPError as e:
+        status_code = e.response.status_code
+
+        if status_code == 401:
+            logger.error("❌ Authentication failed - Invalid API key")
+            logger.error("   Check your ZERO_CRM_API_KEY environment variable")
+
+        elif status_code == 404:
+            logger.error(f"❌ Resource not found: {endpoint}")
+
+        elif status_code == 400:
+            logger.error(f"❌ Bad request: {e.response.text}")
+
+        elif status_code >= 500:
+            logger.error(f"❌ Server error {status_code} after {MAX_RETRIES} retries")
+
+        else:
+            logger.error(f"❌ HTTP error {status_code}: {e.response.text}")
+
+    except Timeout:
+        # Connect timeouts (ConnectTimeout is also a ConnectionError)
+        logger.error(f"❌ Request timed out after {MAX_RETRIES} retries")
+
+    except ConnectionError as e:
+        # Once the retries are used up, a read timeout arrives as a
+        # ConnectionError wrapping urllib3's MaxRetryError, not as Timeout
+        reason = getattr(e.args[0], "reason", None) if e.args else None
+        if isinstance(reason, ReadTimeoutError):
+            logger.error(f"❌ Request timed out after {MAX_RETRIES} retries")
+        else:
+            logger.error(f"❌ Connection failed after {MAX_RETRIES} retries")
+
+    except RequestException as e:
+        logger.error(f"❌ Request error: {e}")
 
     return None
 
 
+class ValidationError(ValueError):
+    """Raised when a record fails client-side validation."""
+
+
 def validate_contact(contact):
     """
     Validate contact data before sending to API.
@@ -136,27 +176,26 @@ def validate_contact(contact):
     Args:
         contact: Contact dictionary
 
-    Returns:
-        (is_valid, error_message)
+    Raises:
+        ValidationError: If the contact is invalid
     """
     # Required fields
-    if not contact.get('name'):
-        return False, "Missing required field: name"
+    name = contact.get('name')
+    if not name:
+        raise ValidationError("Missing required field: name")
 
-    if not contact['name'].strip():
-        return False, "Name cannot be empty"
+    if not name.strip():
+        raise ValidationError("Name cannot be empty")
 
     # Optional email validation
-    email = contact.get('email', '')
-    if email and '@' not in email:
-        return False, f"Invalid email format: {email}"
+    email = contact.get('email')
+    if email and not EMAIL_PATTERN.match(email):
+        raise ValidationError(f"Invalid email format: {email}")
 
     # Optional phone validation
-    phone = contact.get('phone', '')
+    phone = contact.get('phone')
     if phone and len(phone) < 5:
-        return False, f"Phone number too short: {phone}"
-
-    return True, None
+        raise ValidationError(f"Phone number too short: {phone}")
 
 
 def validate_deal(deal):
@@ -166,28 +205,59 @@ def validate_deal(deal):
     Args:
         deal: Deal dictionary
 
-    Returns:
-        (is_valid, error_message)
+    Raises:
+        ValidationError: If the deal is invalid
     """
     # Required fields
     if not deal.get('title'):
-        return False, "Missing required field: title"
+        raise ValidationError("Missing required field: title")
 
     if not deal.get('stage'):
-        return False, "Missing required field: stage"
+        raise ValidationError("Missing required field: stage")
 
     # Value validation
     value = deal.get('value', 0)
     if value < 0:
-        return False, f"Deal value cannot be negative: {value}"
+        raise ValidationError(f"Deal value cannot be negative: {value}")
 
     # Priority validation
-    valid_priorities = ['Low', 'Medium', 'High']
-    priority = deal.get('priority', '')
-    if priority and priority not in valid_priorities:
-        return False, f"Invalid priority: {priority} (must be one of {valid_priorities})"
+    priority = deal.get('priority')
+    if priority and priority not in VALID_PRIORITIES:
+        raise ValidationError(
+            f"Invalid priority: {priority} (must be one of {', '.join(PRIORITIES)})"
+        )
+
+
+def validate_many(rows, validator):
+    """
+    Validate a batch of records, logging a single summary of the failures.
+
+    Args:
+        rows: Iterable of record dictionaries
+        validator: Validation function (validate_contact or validate_deal)
 
-    return True, None
+    Returns:
+        (valid_rows, errors) where errors is a list of (index, message)
+    """
+    valid_rows = []
+    errors = []
+
+    # Bind the list methods once so the loop only touches local names
+    add_valid = valid_rows.append
+    add_error = errors.append
+
+    for index, row in enumerate(rows):
+        try:
+            validator(row)
+        except ValidationError as e:
+            add_error((index, str(e)))
+        else:
+            add_valid(row)
+
+    if errors:
+        logger.warning("⚠️  Skipped %d invalid row(s): %s", len(errors), errors[:5])
+
+    return valid_rows, errors
 
 
 def safe_create_contact(contact):
@@ -195,16 +265,17 @@ def safe_create_contact(contact):
     logger.info("Creating contact with validation...")
 
     # Validate before sending
-    is_valid, error = validate_contact(contact)
-    if not is_valid:
-        logger.error(f"❌ Validation failed: {error}")
+    try:
+        validate_contact(contact)
+    except ValidationError as e:
+        logger.error("❌ Validation failed: %s", e)
         return None
 
     # Make request with retry logic
     result = make_request_with_retry(
         "POST",
         "/api/contacts",
-        json=contact
+        data=encode_json(contact)
     )
 
     if result:
@@ -220,16 +291,17 @@ def safe_create_deal(deal):
     logger.info("Creating deal with validation...")
 
     # Validate before sending
-    is_valid, error = validate_deal(deal)
-    if not is_valid:
-        logger.error(f"❌ Validation failed: {error}")
+    try:
+        validate_deal(deal)
+    except ValidationError as e:
+        logger.error("❌ Validation failed: %s", e)
         return None
 
     # Make request with retry logic
     result = make_request_with_retry(
         "POST",
         "/api/deals",
-        json=deal
+        data=encode_json(deal)
     )
 
     if result:
@@ -318,6 +390,19 @@ def demonstrate_error_scenarios():
     print("="*70)
     make_request_with_retry("GET", "/api/contacts/non-existent-id-12345")
 
+    # Scenario 8: Validate a batch in one pass
+    print("\n" + "="*70)
+    print("Scenario 8: Batch Validation")
+    print("="*70)
+    batch = [
+        {"name": "Batch User 1", "email": "batch1@example.com"},
+        {"email": "no-name@example.com"},
+        {"name": "Batch User 2", "email": "not-an-email"},
+        {"name": "Batch User 3", "phone": "+1-555-0199"}
+    ]
+    valid_batch, _ = validate_many(batch, validate_contact)
+    logger.info("✅ %d of %d contacts ready for bulk import", len(valid_batch), len(batch))
+
     # Cleanup
     if created_contact:
         print("\n" + "="*70)
@@ -331,6 +416,7 @@ def demonstrate_error_scenarios():
 
     print("\n💡 Best Practices:")
     print("   • Always validate data before API calls")
+    print("   • Validate batches up front and log one summary")
     print("   • Implement retry logic for server errors")
     print("   • Don't retry authentication or validation errors")
     print("   • Use exponential backoff for retries")
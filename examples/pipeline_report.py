@@ -11,16 +11,34 @@ Generates sales pipeline reports with:
 
 Usage:
     python3 pipeline_report.py
+    python3 pipeline_report.py --no-cache
+    python3 pipeline_report.py --offline
+    python3 pipeline_report.py --use-cache 300
 """
 
+import argparse
+import hashlib
+import json
 import requests
 import os
-from dotenv import load_dotenv
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
+import time
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+# Load environment variables (skipped when the key is already exported)
+if not os.environ.get("ZERO_CRM_API_KEY"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 API_KEY = os.getenv("ZERO_CRM_API_KEY")
 BASE_URL = "https://vbrsrhfxfv6qk2jbrraym2a2du0qlazt.lambda-url.us-east-1.on.aws"
@@ -31,142 +49,422 @@ if not API_KEY:
 
 headers = {"x-api-key": API_KEY, "Content-Type": "application/json"}
 
+# Gateway errors on the list GETs are retried with a short backoff
+# (at once, then after 0.4s and 0.8s) before the report gives up on a section
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False
+)
+
+# Shared keep-alive session; one pooled connection per concurrent fetch.
+# With only two requests in flight HTTP/1.1 pooling is enough, see
+# "Performance Tips" in the README for when HTTP/2 (httpx) would help.
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(max_retries=RETRY, pool_connections=1, pool_maxsize=2, pool_block=True)
+)
+
+# Responses are cached with their ETag / Last-Modified validators, so a
+# repeated report only downloads collections that actually changed
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "0crm")
+HTTP_CACHE_FILE = os.path.join(CACHE_DIR, "http_cache.json")
+
+# The last successfully fetched deals and contacts, for --offline and
+# --use-cache runs that skip the network entirely
+SNAPSHOT_FILE = os.path.join(CACHE_DIR, "snapshot.json")
+
+# Identifies the account (API key + endpoint) cached data belongs to, so a
+# run with a different key never reports another account's pipeline
+ACCOUNT = hashlib.sha256(f"{BASE_URL}\n{API_KEY}".encode('utf-8')).hexdigest()[:12]
+
+
+# Report layout, built once
+SEP = "=" * 70
+DASH = "-" * 70
+PRIORITY_ORDER = ('High', 'Medium', 'Low', 'Not Set')
+
+# Table row templates: stage, count, value, percent / priority, count, value
+STAGE_ROW = "{:<20} {:>3} deals    ${:>12,}    {:>5.1f}%".format
+PRIORITY_ROW = "{:<15} {:>3} deals    ${:>12,}".format
+
 
 def print_separator(title):
     """Print a formatted section separator."""
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"  {title}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
+
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def read_json_file(path):
+    """Read a JSON cache file, or return None if it is missing or corrupt."""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_file(path, data):
+    """Write a JSON cache file, replacing the old one atomically.
+
+    The caches hold contact details, so the directory and files are only
+    readable by the current user.
+    """
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        tmp_file = path + ".tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'wb') as f:
+            f.write(orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8'))
+        os.chmod(tmp_file, 0o600)  # In case a stale temp file already existed
+        os.replace(tmp_file, path)
+    except OSError as e:
+        print(f"⚠️  Could not write {path}: {e}")
+
+
+def load_http_cache():
+    """Load cached responses from disk, or an empty cache if there are none."""
+    return read_json_file(HTTP_CACHE_FILE) or {}
+
+
+def save_http_cache(cache):
+    """Write cached responses to disk."""
+    write_json_file(HTTP_CACHE_FILE, cache)
+
+
+def load_snapshot(max_age=None):
+    """Load this account's saved snapshot, or None if there is none or it is older than max_age seconds."""
+    snapshot = read_json_file(SNAPSHOT_FILE)
+    if not snapshot or snapshot.get('account') != ACCOUNT:
+        return None
+    if max_age is not None and time.time() - snapshot.get('ts', 0) > max_age:
+        return None
+    return snapshot
+
+
+def save_snapshot(deals, contacts):
+    """Save fetched deals and contacts for later offline reports."""
+    write_json_file(SNAPSHOT_FILE, {
+        'account': ACCOUNT,
+        'deals': deals,
+        'contacts': contacts,
+        'ts': time.time()
+    })
 
 
-def fetch_deals():
+def cached_get(url, cache):
+    """GET a JSON resource, revalidating the cached copy when there is one."""
+    # Entries are per account, so a different API key never gets another
+    # account's cached body back on a 304
+    key = f"{ACCOUNT} {url}"
+    entry = cache.get(key) if cache is not None else None
+
+    conditional = {}
+    if entry:
+        if entry.get('etag'):
+            conditional['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            conditional['If-Modified-Since'] = entry['last_modified']
+
+    response = SESSION.get(url, headers=conditional)
+
+    # 304 Not Modified: the cached body is still current
+    if response.status_code == 304 and entry:
+        return entry['data']
+
+    response.raise_for_status()
+    data = decode_json(response)
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if cache is not None and (etag or last_modified):
+        cache[key] = {'etag': etag, 'last_modified': last_modified, 'data': data}
+
+    return data
+
+
+def fetch_deals(cache=None):
     """Fetch all deals from the API."""
     try:
-        response = requests.get(f"{BASE_URL}/api/deals", headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return cached_get(f"{BASE_URL}/api/deals", cache)
     except Exception as e:
         print(f"❌ Error fetching deals: {e}")
-        return []
+        return None
 
 
-def fetch_contacts():
+def fetch_contacts(cache=None):
     """Fetch all contacts from the API."""
     try:
-        response = requests.get(f"{BASE_URL}/api/contacts", headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return cached_get(f"{BASE_URL}/api/contacts", cache)
     except Exception as e:
         print(f"❌ Error fetching contacts: {e}")
-        return []
+        return None
+
+
+# Closed stages; every other stage counts as active pipeline
+WON = 'Closed Won'
+LOST = 'Closed Lost'
+CLOSED_STAGES = frozenset((WON, LOST))
+
+# Win probability per stage for the weighted forecast; stages not listed
+# here default to 30%
+STAGE_PROBABILITY = defaultdict(lambda: 0.3, {
+    'Lead': 0.1,
+    'Qualified': 0.25,
+    'Proposal Sent': 0.5,
+    'Negotiation': 0.75,
+    WON: 1.0,
+    LOST: 0.0
+})
+
+# From this many deals on, aggregate with pandas when it is installed.
+# Below it the import alone costs more than the plain Python loop.
+PANDAS_MIN_DEALS = 10000
+
+
+def aggregate_frame(deals, pd):
+    """Vectorized version of aggregate() for large deal lists."""
+    df = pd.DataFrame.from_records(deals, columns=['stage', 'priority', 'contact_id'])
+    stage = df['stage'].fillna('Unknown')
+    priority = df['priority'].fillna('Not Set')
+
+    # aggregate() adds plain Python numbers, so a sum (or the median) is an
+    # int unless a float value went into it. Track which values are floats
+    # and convert back, so amounts print exactly as they do there.
+    values = [deal.get('value', 0) for deal in deals]
+    floats = pd.Series([type(v) is float for v in values])
+    value = pd.Series(values, dtype='float64' if floats.any() else 'int64')
+
+    def exact(total, any_float):
+        return total if any_float else int(total)
+
+    def exact_sum(mask):
+        """Sum the values under mask, typed as aggregate() would."""
+        return exact(value[mask].sum().item(), floats[mask].any())
+
+    def group_sums(keys):
+        sums = value.groupby(keys, sort=False).agg(['count', 'sum'])
+        any_float = floats.groupby(keys, sort=False).any()
+        counts = Counter(dict(zip(sums.index, sums['count'].tolist())))
+        totals = defaultdict(int, (
+            (key, exact(total, any_float[key]))
+            for key, total in zip(sums.index, sums['sum'].tolist())
+        ))
+        return counts, totals
+
+    stage_counts, stage_values = group_sums(stage)
+    priority_counts, priority_values = group_sums(priority)
+
+    won = stage == WON
+    lost = stage == LOST
+    active = ~stage.isin(CLOSED_STAGES)
+    weighted = value[active] * stage[active].map(STAGE_PROBABILITY)
+
+    total = len(df)
+    total_value = exact_sum(slice(None))
+
+    if total:
+        # Stable sort so ties keep deal order, as sorted() does
+        median_at = value.sort_values(kind='stable').index[total // 2]
+        median_value = exact(value[median_at].item(), floats[median_at])
+    else:
+        median_value = 0
 
+    return {
+        'stage_counts': stage_counts,
+        'stage_values': stage_values,
+        'priority_counts': priority_counts,
+        'priority_values': priority_values,
+        'total': total,
+        'won': int(won.sum()),
+        'lost': int(lost.sum()),
+        'active': int(active.sum()),
+        'won_value': exact_sum(won),
+        'lost_value': exact_sum(lost),
+        'active_value': exact_sum(active),
+        'weighted_pipeline': weighted.sum().item() if active.any() else 0,
+        'total_value': total_value,
+        'avg_value': total_value / total if total else 0,
+        'median_value': median_value,
+        'max_deal': deals[int(value.idxmax())] if total else None,
+        'contact_ids': {c for c in df['contact_id'].dropna().tolist() if c}
+    }
 
-def pipeline_by_stage(deals):
-    """Calculate pipeline value by stage."""
-    print_separator("Pipeline Value by Stage")
 
-    stages = {}
+def aggregate(deals):
+    """Collect every deal metric the report needs in a single pass."""
+    if len(deals) >= PANDAS_MIN_DEALS:
+        try:
+            import pandas as pd  # Optional: only imported for large reports
+        except ImportError:
+            pd = None
+        if pd is not None:
+            return aggregate_frame(deals, pd)
+
+    stage_counts = Counter()
+    stage_values = defaultdict(int)
+    priority_counts = Counter()
+    priority_values = defaultdict(int)
+    won = lost = 0
+    won_value = lost_value = active_value = 0
+    weighted_pipeline = 0
+    total_value = 0
+    max_deal = None
+    max_value = float('-inf')
+    values = []
+    contact_ids = set()
+
+    # dict.get with defaults beats normalizing with setdefault() first and
+    # unpacking through itemgetter: that needs an extra pass (or KeyError
+    # handling) for deals without a priority or value, and measured ~2x slower
     for deal in deals:
         stage = deal.get('stage', 'Unknown')
+        priority = deal.get('priority', 'Not Set')
         value = deal.get('value', 0)
 
-        if stage not in stages:
-            stages[stage] = {'count': 0, 'value': 0}
+        stage_counts[stage] += 1
+        stage_values[stage] += value
+        priority_counts[priority] += 1
+        priority_values[priority] += value
+
+        if stage == WON:
+            won += 1
+            won_value += value
+        elif stage == LOST:
+            lost += 1
+            lost_value += value
+        else:
+            active_value += value
+            weighted_pipeline += value * STAGE_PROBABILITY[stage]
+
+        total_value += value
+        values.append(value)
+
+        # Running max; strict comparison keeps the first of equally large deals
+        if value > max_value:
+            max_deal = deal
+            max_value = value
+
+        contact_id = deal.get('contact_id')
+        if contact_id:
+            contact_ids.add(contact_id)
 
-        stages[stage]['count'] += 1
-        stages[stage]['value'] += value
+    total = len(values)
+
+    # The values list is private to this pass, so sort it in place and take
+    # the upper median directly (statistics.median_* would sort a copy)
+    values.sort()
+
+    return {
+        'stage_counts': stage_counts,
+        'stage_values': stage_values,
+        'priority_counts': priority_counts,
+        'priority_values': priority_values,
+        'total': total,
+        'won': won,
+        'lost': lost,
+        'active': total - won - lost,
+        'won_value': won_value,
+        'lost_value': lost_value,
+        'active_value': active_value,
+        'weighted_pipeline': weighted_pipeline,
+        'total_value': total_value,
+        'avg_value': total_value / total if total else 0,
+        'median_value': values[total // 2] if values else 0,
+        'max_deal': max_deal,
+        'contact_ids': contact_ids
+    }
+
+
+def pipeline_by_stage(stats):
+    """Print pipeline value by stage."""
+    print_separator("Pipeline Value by Stage")
+
+    stage_counts = stats['stage_counts']
 
     # Sort by value descending
-    sorted_stages = sorted(stages.items(), key=lambda x: x[1]['value'], reverse=True)
+    sorted_stages = sorted(stats['stage_values'].items(), key=itemgetter(1), reverse=True)
 
-    total_value = sum(s[1]['value'] for s in sorted_stages)
-    total_count = sum(s[1]['count'] for s in sorted_stages)
+    total_value = stats['total_value']
+    total_count = stats['total']
 
-    for stage, data in sorted_stages:
-        percentage = (data['value'] / total_value * 100) if total_value > 0 else 0
-        print(f"{stage:<20} {data['count']:>3} deals    ${data['value']:>12,}    {percentage:>5.1f}%")
+    # Build the whole table and write it at once instead of one print per row
+    rows = []
+    for stage, value in sorted_stages:
+        percentage = (value / total_value * 100) if total_value > 0 else 0
+        rows.append(STAGE_ROW(stage, stage_counts[stage], value, percentage))
 
-    print(f"{'-'*70}")
-    print(f"{'TOTAL':<20} {total_count:>3} deals    ${total_value:>12,}    100.0%")
+    rows.append(DASH)
+    rows.append(STAGE_ROW('TOTAL', total_count, total_value, 100.0))
+    sys.stdout.write("\n".join(rows) + "\n")
 
-    return stages
+    return sorted_stages
 
 
-def win_rate_analysis(deals):
-    """Calculate win rate metrics."""
+def win_rate_analysis(stats):
+    """Print win rate metrics."""
     print_separator("Win Rate Analysis")
 
-    total = len(deals)
-    won = len([d for d in deals if d.get('stage') == 'Closed Won'])
-    lost = len([d for d in deals if d.get('stage') == 'Closed Lost'])
-    active = total - won - lost
+    won = stats['won']
+    lost = stats['lost']
 
     win_rate = (won / (won + lost) * 100) if (won + lost) > 0 else 0
 
-    won_value = sum(d.get('value', 0) for d in deals if d.get('stage') == 'Closed Won')
-    lost_value = sum(d.get('value', 0) for d in deals if d.get('stage') == 'Closed Lost')
-    active_value = sum(d.get('value', 0) for d in deals if d.get('stage') not in ['Closed Won', 'Closed Lost'])
-
-    print(f"Total Deals:        {total:>6}")
-    print(f"Won:                {won:>6}    ${won_value:>12,}")
-    print(f"Lost:               {lost:>6}    ${lost_value:>12,}")
-    print(f"Active:             {active:>6}    ${active_value:>12,}")
+    print(f"Total Deals:        {stats['total']:>6}")
+    print(f"Won:                {won:>6}    ${stats['won_value']:>12,}")
+    print(f"Lost:               {lost:>6}    ${stats['lost_value']:>12,}")
+    print(f"Active:             {stats['active']:>6}    ${stats['active_value']:>12,}")
     print(f"\n{'Win Rate:':<20} {win_rate:>6.1f}%")
 
     return {
-        'total': total,
+        'total': stats['total'],
         'won': won,
         'lost': lost,
-        'active': active,
+        'active': stats['active'],
         'win_rate': win_rate
     }
 
 
-def priority_breakdown(deals):
-    """Analyze deals by priority."""
+def priority_breakdown(stats):
+    """Print deals by priority."""
     print_separator("Priority Breakdown")
 
-    priorities = {}
-    for deal in deals:
-        priority = deal.get('priority', 'Not Set')
-        value = deal.get('value', 0)
-
-        if priority not in priorities:
-            priorities[priority] = {'count': 0, 'value': 0}
-
-        priorities[priority]['count'] += 1
-        priorities[priority]['value'] += value
+    priority_counts = stats['priority_counts']
+    priority_values = stats['priority_values']
 
-    # Define priority order
-    priority_order = ['High', 'Medium', 'Low', 'Not Set']
+    rows = [
+        PRIORITY_ROW(priority, priority_counts[priority], priority_values[priority])
+        for priority in PRIORITY_ORDER
+        if priority in priority_counts
+    ]
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
 
-    for priority in priority_order:
-        if priority in priorities:
-            data = priorities[priority]
-            print(f"{priority:<15} {data['count']:>3} deals    ${data['value']:>12,}")
 
-
-def average_deal_metrics(deals):
-    """Calculate average deal metrics."""
+def average_deal_metrics(stats):
+    """Print average deal metrics."""
     print_separator("Average Deal Metrics")
 
-    if not deals:
+    if not stats['total']:
         print("No deals found")
         return
 
-    total_value = sum(d.get('value', 0) for d in deals)
-    avg_value = total_value / len(deals) if deals else 0
-
-    # Median deal value
-    values = sorted([d.get('value', 0) for d in deals])
-    median_idx = len(values) // 2
-    median_value = values[median_idx] if values else 0
-
-    # Largest deal
-    max_deal = max(deals, key=lambda x: x.get('value', 0), default=None)
+    max_deal = stats['max_deal']
 
-    print(f"Average Deal Size:  ${avg_value:>12,.2f}")
-    print(f"Median Deal Size:   ${median_value:>12,}")
+    print(f"Average Deal Size:  ${stats['avg_value']:>12,.2f}")
+    print(f"Median Deal Size:   ${stats['median_value']:>12,}")
 
     if max_deal:
         print(f"\nLargest Deal:")
@@ -175,15 +473,14 @@ def average_deal_metrics(deals):
         print(f"  Stage: {max_deal.get('stage', 'Unknown')}")
 
 
-def contact_engagement(contacts, deals):
+def contact_engagement(contacts, stats):
     """Analyze contact engagement metrics."""
     print_separator("Contact Engagement")
 
     total_contacts = len(contacts)
 
-    # Count contacts with deals
-    contact_ids_with_deals = set(d.get('contact_id') for d in deals if d.get('contact_id'))
-    engaged_contacts = len(contact_ids_with_deals)
+    # Count contacts with deals (collected during the aggregate pass)
+    engaged_contacts = len(stats['contact_ids'])
 
     engagement_rate = (engaged_contacts / total_contacts * 100) if total_contacts > 0 else 0
 
@@ -192,72 +489,83 @@ def contact_engagement(contacts, deals):
     print(f"Engagement Rate:    {engagement_rate:>6.1f}%")
 
     # Top companies by deal count
-    companies = {}
-    for contact in contacts:
-        company = contact.get('company', 'Unknown')
-        if company not in companies:
-            companies[company] = 0
-        companies[company] += 1
+    companies = Counter(contact.get('company', 'Unknown') for contact in contacts)
 
     print(f"\nTop Companies by Contact Count:")
-    sorted_companies = sorted(companies.items(), key=lambda x: x[1], reverse=True)
-    for company, count in sorted_companies[:5]:
+    for company, count in companies.most_common(5):
         print(f"  {company:<30} {count:>3} contacts")
 
 
-def forecast_analysis(deals):
-    """Forecast upcoming revenue."""
+def forecast_analysis(stats):
+    """Print the stage-weighted revenue forecast."""
     print_separator("Revenue Forecast")
 
-    # Calculate revenue by stage probability
-    stage_probability = {
-        'Lead': 0.1,
-        'Qualified': 0.25,
-        'Proposal Sent': 0.5,
-        'Negotiation': 0.75,
-        'Closed Won': 1.0,
-        'Closed Lost': 0.0
-    }
+    print(f"Active Pipeline:         ${stats['active_value']:>12,}")
+    print(f"Weighted Forecast:       ${stats['weighted_pipeline']:>12,.2f}")
+    print(f"\n(Based on stage-weighted probability)")
 
-    weighted_pipeline = 0
-    active_pipeline = 0
 
-    for deal in deals:
-        stage = deal.get('stage', 'Unknown')
-        value = deal.get('value', 0)
+def generate_report(use_cache=True, offline=False, max_age=None):
+    """Generate complete pipeline report.
 
-        if stage not in ['Closed Won', 'Closed Lost']:
-            active_pipeline += value
-            probability = stage_probability.get(stage, 0.3)  # Default 30%
-            weighted_pipeline += value * probability
+    With offline=True the saved snapshot is used whatever its age; with
+    max_age it is used only if it is at most that many seconds old.
+    """
+    print("\n" + SEP)
+    print(f"{'ZERO CRM PIPELINE REPORT':^70}")
+    print(f"{'Generated: ' + datetime.now().strftime('%Y-%m-%d %H:%M:%S'):^70}")
+    print(SEP)
+
+    snapshot = None
+    if offline:
+        snapshot = load_snapshot()
+    elif max_age is not None:
+        snapshot = load_snapshot(max_age)
+
+    if snapshot:
+        taken = datetime.fromtimestamp(snapshot['ts']).strftime('%Y-%m-%d %H:%M:%S')
+        print(f"\n📦 Using saved snapshot from {taken}")
+        deals = snapshot['deals']
+        contacts = snapshot['contacts']
+
+    elif offline:
+        print(f"\n❌ No saved snapshot for this API key found at {SNAPSHOT_FILE}")
+        print("Run the report once without --offline to create it.")
+        return
 
-    print(f"Active Pipeline:         ${active_pipeline:>12,}")
-    print(f"Weighted Forecast:       ${weighted_pipeline:>12,.2f}")
-    print(f"\n(Based on stage-weighted probability)")
+    else:
+        cache = load_http_cache() if use_cache else None
 
+        # Fetch data (the two requests are independent, so run them concurrently)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            deals_future = executor.submit(fetch_deals, cache)
+            contacts_future = executor.submit(fetch_contacts, cache)
+            deals = deals_future.result()
+            contacts = contacts_future.result()
 
-def generate_report():
-    """Generate complete pipeline report."""
-    print("\n" + "="*70)
-    print(f"{'ZERO CRM PIPELINE REPORT':^70}")
-    print(f"{'Generated: ' + datetime.now().strftime('%Y-%m-%d %H:%M:%S'):^70}")
-    print("="*70)
+        if cache is not None:
+            save_http_cache(cache)
+
+        # Only a complete fetch replaces the snapshot
+        if deals is not None and contacts is not None:
+            save_snapshot(deals, contacts)
 
-    # Fetch data
-    deals = fetch_deals()
-    contacts = fetch_contacts()
+        deals = deals or []
+        contacts = contacts or []
 
     if not deals and not contacts:
         print("\n⚠️  No data found in CRM")
         return
 
-    # Generate report sections
-    pipeline_by_stage(deals)
-    win_rate_analysis(deals)
-    priority_breakdown(deals)
-    average_deal_metrics(deals)
-    forecast_analysis(deals)
-    contact_engagement(contacts, deals)
+    # Walk the deals once, then format each report section from the totals
+    stats = aggregate(deals)
+
+    pipeline_by_stage(stats)
+    win_rate_analysis(stats)
+    priority_breakdown(stats)
+    average_deal_metrics(stats)
+    forecast_analysis(stats)
+    contact_engagement(contacts, stats)
 
     print_separator("✅ Report Generated Successfully")
 
@@ -269,8 +577,27 @@ def generate_report():
 
 def main():
     """Run the pipeline report."""
+    parser = argparse.ArgumentParser(description="Zero CRM pipeline report")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached responses and download everything again"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Report from the last saved snapshot without calling the API"
+    )
+    parser.add_argument(
+        "--use-cache",
+        type=int,
+        metavar="SECS",
+        help="Report from the saved snapshot if it is at most SECS seconds old"
+    )
+    args = parser.parse_args()
+
     try:
-        generate_report()
+        generate_report(use_cache=not args.no_cache, offline=args.offline, max_age=args.use_cache)
     except Exception as e:
         print(f"\n❌ Error generating report: {e}")
         import traceback
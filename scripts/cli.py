@@ -20,12 +20,38 @@ Commands:
 
 import sys
 import argparse
-import requests
+import functools
+import json
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+
+def find_env_file():
+    """Find the nearest .env file, searching upwards from this script like python-dotenv."""
+    path = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(path, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+# Load environment variables from .env unless the key is already set;
+# python-dotenv is only imported when there is a .env file to read
+if not os.environ.get("ZERO_CRM_API_KEY"):
+    ENV_FILE = find_env_file()
+    if ENV_FILE:
+        from dotenv import load_dotenv
+        load_dotenv(ENV_FILE)
 
 BASE_URL = "https://vbrsrhfxfv6qk2jbrraym2a2du0qlazt.lambda-url.us-east-1.on.aws"
 
@@ -40,6 +66,88 @@ def get_headers():
     return {"x-api-key": api_key, "Content-Type": "application/json"}
 
 
+_session = None
+
+
+def get_session():
+    """Get the shared API session, creating it on first use.
+
+    The session keeps HTTPS connections alive between requests, so
+    commands that make several calls reuse them instead of paying a new
+    TLS handshake each time (two pooled connections for `test`).
+    It is created lazily so --help works and a missing API key is
+    reported before any request is made; requests itself is imported here
+    too, so --help and argument errors never pay for loading it.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Retry gateway errors with a short backoff (at once, then after 0.4s
+        # and 0.8s); only idempotent methods are retried, so a POST is never
+        # sent twice
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False
+        )
+
+        _session = requests.Session()
+        _session.headers.update(get_headers())
+        _session.mount(
+            "https://",
+            HTTPAdapter(max_retries=retry, pool_connections=1, pool_maxsize=2, pool_block=True)
+        )
+    return _session
+
+
+def api_call(method, path, body=None, expected_status=200):
+    """Decorate a command that displays the result of one API request.
+
+    path is formatted with the parsed arguments (e.g. "/api/deals/{id}")
+    or called with them if it is a function; body, if given, builds the
+    JSON payload from the arguments. The decorated function is only
+    called with (args, data) on the expected status; anything else is
+    reported and exits with status 1.
+    """
+    def decorator(show):
+        @functools.wraps(show)
+        def command(args):
+            url = BASE_URL + (path(args) if callable(path) else path.format(**vars(args)))
+            payload = body(args) if body else None
+
+            response = get_session().request(
+                method,
+                url,
+                data=encode_json(payload) if payload is not None else None
+            )
+
+            if response.status_code != expected_status:
+                print(f"❌ Error: {response.status_code} - {response.text}")
+                sys.exit(1)
+
+            show(args, decode_json(response))
+        return command
+    return decorator
+
+
+def encode_json(payload):
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def format_contact(contact):
     """Format contact for display."""
     print(f"\n📇 {contact['name']}")
@@ -73,23 +181,8 @@ def format_deal(deal):
         print(f"   Notes:    {deal['notes']}")
 
 
-def cmd_contacts_list(args):
-    """List all contacts."""
-    response = requests.get(f"{BASE_URL}/api/contacts", headers=get_headers())
-
-    if response.status_code == 200:
-        contacts = response.json()
-        print(f"\nFound {len(contacts)} contact(s):")
-
-        for contact in contacts:
-            format_contact(contact)
-    else:
-        print(f"❌ Error: {response.status_code} - {response.text}")
-        sys.exit(1)
-
-
-def cmd_contacts_create(args):
-    """Create a new contact."""
+def contact_from_args(args):
+    """Build a contact payload from the create arguments."""
     contact = {"name": args.name}
 
     if args.email:
@@ -105,63 +198,11 @@ def cmd_contacts_create(args):
     if args.notes:
         contact["notes"] = args.notes
 
-    response = requests.post(
-        f"{BASE_URL}/api/contacts",
-        headers=get_headers(),
-        json=contact
-    )
-
-    if response.status_code == 201:
-        result = response.json()
-        created = result.get('created', [{}])[0]
-        print("✅ Contact created successfully:")
-        format_contact(created)
-    else:
-        print(f"❌ Error: {response.status_code} - {response.text}")
-        sys.exit(1)
-
-
-def cmd_contacts_delete(args):
-    """Delete a contact."""
-    response = requests.delete(
-        f"{BASE_URL}/api/contacts/{args.id}",
-        headers=get_headers()
-    )
-
-    if response.status_code == 200:
-        result = response.json()
-        print(f"✅ {result['message']}")
-    else:
-        print(f"❌ Error: {response.status_code} - {response.text}")
-        sys.exit(1)
-
-
-def cmd_deals_list(args):
-    """List all deals."""
-    response = requests.get(f"{BASE_URL}/api/deals", headers=get_headers())
-
-    if response.status_code == 200:
-        deals = response.json()
+    return contact
 
-        # Filter by stage if provided
-        if args.stage:
-            deals = [d for d in deals if d.get('stage') == args.stage]
 
-        print(f"\nFound {len(deals)} deal(s):")
-
-        for deal in deals:
-            format_deal(deal)
-
-        # Show total value
-        total_value = sum(d.get('value', 0) for d in deals)
-        print(f"\n💰 Total value: ${total_value:,}")
-    else:
-        print(f"❌ Error: {response.status_code} - {response.text}")
-        sys.exit(1)
-
-
-def cmd_deals_create(args):
-    """Create a new deal."""
+def deal_from_args(args):
+    """Build a deal payload from the create arguments."""
     deal = {
         "title": args.title,
         "stage": args.stage
@@ -176,24 +217,11 @@ def cmd_deals_create(args):
     if args.notes:
         deal["notes"] = args.notes
 
-    response = requests.post(
-        f"{BASE_URL}/api/deals",
-        headers=get_headers(),
-        json=deal
-    )
-
-    if response.status_code == 201:
-        result = response.json()
-        created = result.get('created', [{}])[0]
-        print("✅ Deal created successfully:")
-        format_deal(created)
-    else:
-        print(f"❌ Error: {response.status_code} - {response.text}")
-        sys.exit(1)
+    return deal
 
 
-def cmd_deals_update(args):
-    """Update a deal."""
+def deal_updates_from_args(args):
+    """Build a deal update payload, exiting if nothing was given."""
     updates = {}
 
     if args.title:
@@ -211,62 +239,107 @@ def cmd_deals_update(args):
         print("❌ No updates provided")
         sys.exit(1)
 
-    response = requests.patch(
-        f"{BASE_URL}/api/deals/{args.id}",
-        headers=get_headers(),
-        json=updates
-    )
+    return updates
 
-    if response.status_code == 200:
-        updated = response.json()
-        print("✅ Deal updated successfully:")
-        format_deal(updated)
-    else:
-        print(f"❌ Error: {response.status_code} - {response.text}")
-        sys.exit(1)
 
+def deals_list_path(args):
+    """Build the deals list path, asking the server to filter by stage."""
+    if args.stage:
+        return f"/api/deals?stage={quote(args.stage, safe='')}"
+    return "/api/deals"
 
-def cmd_deals_delete(args):
-    """Delete a deal."""
-    response = requests.delete(
-        f"{BASE_URL}/api/deals/{args.id}",
-        headers=get_headers()
-    )
 
-    if response.status_code == 200:
-        result = response.json()
-        print(f"✅ {result['message']}")
-    else:
-        print(f"❌ Error: {response.status_code} - {response.text}")
-        sys.exit(1)
+@api_call("GET", "/api/contacts")
+def cmd_contacts_list(args, contacts):
+    """List all contacts."""
+    print(f"\nFound {len(contacts)} contact(s):")
 
+    for contact in contacts:
+        format_contact(contact)
 
-def cmd_profile(args):
-    """Show user profile."""
-    response = requests.get(f"{BASE_URL}/api/user/profile", headers=get_headers())
 
-    if response.status_code == 200:
-        profile = response.json()
-        print("\n👤 User Profile")
-        print(f"   ID:       {profile['id']}")
-        print(f"   Email:    {profile['email']}")
-        print(f"   API Key:  {profile['apiKey'][:10]}...{profile['apiKey'][-5:]}")
-        print(f"   Created:  {profile.get('created_at', 'N/A')}")
-    else:
-        print(f"❌ Error: {response.status_code} - {response.text}")
-        sys.exit(1)
+@api_call("POST", "/api/contacts", body=contact_from_args, expected_status=201)
+def cmd_contacts_create(args, result):
+    """Create a new contact."""
+    created = result.get('created', [{}])[0]
+    print("✅ Contact created successfully:")
+    format_contact(created)
+
+
+@api_call("DELETE", "/api/contacts/{id}")
+def cmd_contacts_delete(args, result):
+    """Delete a contact."""
+    print(f"✅ {result['message']}")
+
+
+@api_call("GET", deals_list_path)
+def cmd_deals_list(args, deals):
+    """List all deals."""
+    # Filter by stage if provided (still needed if the server ignores ?stage=)
+    if args.stage:
+        deals = [d for d in deals if d.get('stage') == args.stage]
+
+    print(f"\nFound {len(deals)} deal(s):")
+
+    for deal in deals:
+        format_deal(deal)
+
+    # Show total value
+    total_value = sum(d.get('value', 0) for d in deals)
+    print(f"\n💰 Total value: ${total_value:,}")
+
+
+@api_call("POST", "/api/deals", body=deal_from_args, expected_status=201)
+def cmd_deals_create(args, result):
+    """Create a new deal."""
+    created = result.get('created', [{}])[0]
+    print("✅ Deal created successfully:")
+    format_deal(created)
+
+
+@api_call("PATCH", "/api/deals/{id}", body=deal_updates_from_args)
+def cmd_deals_update(args, updated):
+    """Update a deal."""
+    print("✅ Deal updated successfully:")
+    format_deal(updated)
+
+
+@api_call("DELETE", "/api/deals/{id}")
+def cmd_deals_delete(args, result):
+    """Delete a deal."""
+    print(f"✅ {result['message']}")
+
+
+@api_call("GET", "/api/user/profile")
+def cmd_profile(args, profile):
+    """Show user profile."""
+    print("\n👤 User Profile")
+    print(f"   ID:       {profile['id']}")
+    print(f"   Email:    {profile['email']}")
+    print(f"   API Key:  {profile['apiKey'][:10]}...{profile['apiKey'][-5:]}")
+    print(f"   Created:  {profile.get('created_at', 'N/A')}")
 
 
 def cmd_test(args):
     """Test API connection."""
     print("\n🔍 Testing Zero CRM API Connection...\n")
 
+    # The two checks are independent, so send both requests at once and
+    # report the results in order. The health check drops the session's
+    # API key, since it must work without auth.
+    session = get_session()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        health_future = executor.submit(
+            session.get, f"{BASE_URL}/api/health", headers={"x-api-key": None}
+        )
+        profile_future = executor.submit(session.get, f"{BASE_URL}/api/user/profile")
+
     # Test 1: Health check
     print("1. Testing health endpoint...")
-    response = requests.get(f"{BASE_URL}/api/health")
+    response = health_future.result()
 
     if response.status_code == 200:
-        data = response.json()
+        data = decode_json(response)
         print(f"   ✅ Health check passed: {data}")
     else:
         print(f"   ❌ Health check failed: {response.status_code}")
@@ -274,10 +347,10 @@ def cmd_test(args):
 
     # Test 2: Authentication
     print("\n2. Testing authentication...")
-    response = requests.get(f"{BASE_URL}/api/user/profile", headers=get_headers())
+    response = profile_future.result()
 
     if response.status_code == 200:
-        data = response.json()
+        data = decode_json(response)
         print(f"   ✅ Authentication successful")
         print(f"      User: {data.get('email', 'N/A')}")
     else:
@@ -287,17 +360,9 @@ def cmd_test(args):
     print("\n✅ All tests passed! API is working correctly.")
 
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="Zero CRM CLI Tool",
-        epilog="For more information, visit: https://github.com/thierryteisseire/0crm-skill"
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # Contacts commands
-    contacts_parser = subparsers.add_parser("contacts", help="Manage contacts")
+def add_contacts_parser(subparsers):
+    """Add the contacts command and its subcommands."""
+    contacts_parser = subparsers.add_parser("contacts", help=COMMAND_HELP["contacts"])
     contacts_sub = contacts_parser.add_subparsers(dest="subcommand")
 
     # contacts list
@@ -317,8 +382,12 @@ def main():
     delete_contact_parser = contacts_sub.add_parser("delete", help="Delete a contact")
     delete_contact_parser.add_argument("id", help="Contact ID")
 
-    # Deals commands
-    deals_parser = subparsers.add_parser("deals", help="Manage deals")
+    return contacts_parser
+
+
+def add_deals_parser(subparsers):
+    """Add the deals command and its subcommands."""
+    deals_parser = subparsers.add_parser("deals", help=COMMAND_HELP["deals"])
     deals_sub = deals_parser.add_subparsers(dest="subcommand")
 
     # deals list
@@ -347,9 +416,65 @@ def main():
     delete_deal_parser = deals_sub.add_parser("delete", help="Delete a deal")
     delete_deal_parser.add_argument("id", help="Deal ID")
 
-    # Other commands
-    subparsers.add_parser("profile", help="Show user profile")
-    subparsers.add_parser("test", help="Test API connection")
+    return deals_parser
+
+
+def add_profile_parser(subparsers):
+    """Add the profile command."""
+    return subparsers.add_parser("profile", help=COMMAND_HELP["profile"])
+
+
+def add_test_parser(subparsers):
+    """Add the test command."""
+    return subparsers.add_parser("test", help=COMMAND_HELP["test"])
+
+
+# Top-level commands, in --help order: their help text, and the builder
+# for their full parser subtree
+COMMAND_HELP = {
+    "contacts": "Manage contacts",
+    "deals": "Manage deals",
+    "profile": "Show user profile",
+    "test": "Test API connection"
+}
+
+COMMAND_PARSERS = {
+    "contacts": add_contacts_parser,
+    "deals": add_deals_parser,
+    "profile": add_profile_parser,
+    "test": add_test_parser
+}
+
+
+def build_parser(command=None):
+    """Build the argument parser and return it with the command parsers.
+
+    Every command is listed, so usage lines and errors are unchanged, but
+    when the first argument names a known command only that command's
+    subtree is built; --help and unknown commands get the full tree.
+    """
+    parser = argparse.ArgumentParser(
+        description="Zero CRM CLI Tool",
+        epilog="For more information, visit: https://github.com/thierryteisseire/0crm-skill"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    command_parsers = {}
+    for name, add_parser in COMMAND_PARSERS.items():
+        if command not in COMMAND_PARSERS or name == command:
+            command_parsers[name] = add_parser(subparsers)
+        else:
+            subparsers.add_parser(name, help=COMMAND_HELP[name])  # Listed only
+
+    return parser, command_parsers
+
+
+def main():
+    """Main CLI entry point."""
+    # Dispatch on the first token so only the relevant parsers are built
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    parser, command_parsers = build_parser(command)
 
     args = parser.parse_args()
 
@@ -367,7 +492,7 @@ def main():
             elif args.subcommand == "delete":
                 cmd_contacts_delete(args)
             else:
-                contacts_parser.print_help()
+                command_parsers["contacts"].print_help()
 
         elif args.command == "deals":
             if args.subcommand == "list":
@@ -379,7 +504,7 @@ def main():
             elif args.subcommand == "delete":
                 cmd_deals_delete(args)
             else:
-                deals_parser.print_help()
+                command_parsers["deals"].print_help()
 
         elif args.command == "profile":
             cmd_profile(args)
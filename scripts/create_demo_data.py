@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
+import json
 import requests
 import os
 import sys
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+# Load environment variables (skipped when the key is already exported)
+if not os.environ.get("ZERO_CRM_API_KEY"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 API_KEY = os.getenv("ZERO_CRM_API_KEY")
 BASE_URL = "https://vbrsrhfxfv6qk2jbrraym2a2du0qlazt.lambda-url.us-east-1.on.aws"
@@ -16,6 +26,61 @@ if not API_KEY:
 
 headers = {"x-api-key": API_KEY, "Content-Type": "application/json"}
 
+# Records per bulk POST, and how many of those POSTs run at once
+CHUNK_SIZE = 100
+MAX_WORKERS = 4
+
+# All bulk POSTs share the same keep-alive connection pool (HTTP/1.1, one
+# connection per worker; see the README on HTTP/2). Gateway errors
+# are retried for idempotent requests only, so the POSTs are never resent.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False
+)
+
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(max_retries=RETRY, pool_connections=1, pool_maxsize=MAX_WORKERS, pool_block=True)
+)
+
+def encode_json(payload):
+    """Serialize a request body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def post_chunks(executor, endpoint, records):
+    """Submit one bulk POST per CHUNK_SIZE records and return the futures."""
+    return [
+        executor.submit(SESSION.post, f"{BASE_URL}{endpoint}", data=encode_json(records[i:i + CHUNK_SIZE]))
+        for i in range(0, len(records), CHUNK_SIZE)
+    ]
+
+
+def collect_created(futures, label):
+    """Wait for the bulk POSTs and return all created records, or None on failure."""
+    created = []
+    for future in futures:
+        response = future.result()
+        if response.status_code != 201:
+            print(f"❌ Failed to create {label}: {response.text}")
+            return None
+        created.extend(decode_json(response).get('created', []))
+    return created
+
+
 def create_demo_data():
     print("🚀 Creating Mockup Contacts...")
     
@@ -62,71 +127,70 @@ def create_demo_data():
         }
     ]
 
-    response = requests.post(f"{BASE_URL}/api/contacts", headers=headers, json=contacts_data)
-    if response.status_code != 201:
-        print(f"❌ Failed to create contacts: {response.text}")
-        return
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        contact_futures = post_chunks(executor, "/api/contacts", contacts_data)
 
-    created_contacts = response.json().get('created', [])
-    print(f"✅ Created {len(created_contacts)} contacts.")
+        # Deals only need the contact IDs, so build them while the
+        # contacts are being created and fill in the IDs afterwards
+        deal_templates = {
+            "Alice Freeman": {
+                "title": "EcoFlow Enterprise Suite",
+                "value": 45000,
+                "stage": "Negotiation",
+                "priority": "High",
+                "notes": "Annual subscription for UK and EU teams."
+            },
+            "Bob Miller": {
+                "title": "MegaMart Global Rollout",
+                "value": 120000,
+                "stage": "Qualified",
+                "priority": "High",
+                "notes": "Target for Q3 implementation."
+            },
+            "Charlie Zhang": {
+                "title": "Zenith CRM Integration",
+                "value": 15000,
+                "stage": "Proposal Sent",
+                "priority": "Medium",
+                "notes": "Technical assessment in progress."
+            },
+            "Diana Prince": {
+                "title": "WonderWorks Supply Chain",
+                "value": 60000,
+                "stage": "Lead",
+                "priority": "High",
+                "notes": "Initial discovery call scheduled."
+            },
+            "Edward Norton": {
+                "title": "Skyline Office Design",
+                "value": 25000,
+                "stage": "Closed Won",
+                "priority": "Medium",
+                "notes": "Contract signed on 2024-02-05."
+            }
+        }
 
-    # Sort contacts by name to map correctly to deals
-    created_contacts.sort(key=lambda x: x['name'])
-    
-    # Map names to IDs
-    contact_map = {c['name']: c['id'] for c in created_contacts}
+        created_contacts = collect_created(contact_futures, "contacts")
+        if created_contacts is None:
+            return
 
-    print("\n🚀 Creating Mockup Deals (Linked to Contacts)...")
-    
-    deals_data = [
-        {
-            "title": "EcoFlow Enterprise Suite",
-            "value": 45000,
-            "stage": "Negotiation",
-            "priority": "High",
-            "contact_id": contact_map.get("Alice Freeman"),
-            "notes": "Annual subscription for UK and EU teams."
-        },
-        {
-            "title": "MegaMart Global Rollout",
-            "value": 120000,
-            "stage": "Qualified",
-            "priority": "High",
-            "contact_id": contact_map.get("Bob Miller"),
-            "notes": "Target for Q3 implementation."
-        },
-        {
-            "title": "Zenith CRM Integration",
-            "value": 15000,
-            "stage": "Proposal Sent",
-            "priority": "Medium",
-            "contact_id": contact_map.get("Charlie Zhang"),
-            "notes": "Technical assessment in progress."
-        },
-        {
-            "title": "WonderWorks Supply Chain",
-            "value": 60000,
-            "stage": "Lead",
-            "priority": "High",
-            "contact_id": contact_map.get("Diana Prince"),
-            "notes": "Initial discovery call scheduled."
-        },
-        {
-            "title": "Skyline Office Design",
-            "value": 25000,
-            "stage": "Closed Won",
-            "priority": "Medium",
-            "contact_id": contact_map.get("Edward Norton"),
-            "notes": "Contract signed on 2024-02-05."
-        }
-    ]
+        print(f"✅ Created {len(created_contacts)} contacts.")
+
+        # Map names to IDs; lookups are by name, so the order the server
+        # (or the concurrent chunks) returned the contacts in doesn't matter
+        contact_map = {c['name']: c['id'] for c in created_contacts}
+
+        print("\n🚀 Creating Mockup Deals (Linked to Contacts)...")
+
+        deals_data = [
+            {**deal, "contact_id": contact_map.get(name)}
+            for name, deal in deal_templates.items()
+        ]
 
-    response = requests.post(f"{BASE_URL}/api/deals", headers=headers, json=deals_data)
-    if response.status_code != 201:
-        print(f"❌ Failed to create deals: {response.text}")
-        return
+        created_deals = collect_created(post_chunks(executor, "/api/deals", deals_data), "deals")
+        if created_deals is None:
+            return
 
-    created_deals = response.json().get('created', [])
     print(f"✅ Created {len(created_deals)} deals.")
     
     print("\n🎉 Demo data created successfully!")
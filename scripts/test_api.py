@@ -1,20 +1,49 @@
 import requests
 import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: faster JSON encoding/decoding
+except ImportError:
+    orjson = None
 
 BASE_URL = "https://vbrsrhfxfv6qk2jbrraym2a2du0qlazt.lambda-url.us-east-1.on.aws"
 
+# The health and profile checks share one keep-alive connection, and
+# gateway errors (502/503/504) are retried with a short backoff
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False
+)
+
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(max_retries=RETRY, pool_connections=1, pool_maxsize=1)
+)
+
+def decode_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def test_connection(api_key):
     headers = {"x-api-key": api_key}
     
     # Test Health
     try:
-        health = requests.get(f"{BASE_URL}/api/health")
-        print(f"Health Check: {health.status_code} - {health.json()}")
+        health = SESSION.get(f"{BASE_URL}/api/health")
+        print(f"Health Check: {health.status_code} - {decode_json(health)}")
         
         # Test Auth with Profile
-        profile = requests.get(f"{BASE_URL}/api/user/profile", headers=headers)
+        profile = SESSION.get(f"{BASE_URL}/api/user/profile", headers=headers)
         if profile.status_code == 200:
-            print(f"Auth Success! Logged in as: {profile.json().get('id')}")
+            print(f"Auth Success! Logged in as: {decode_json(profile).get('id')}")
             return True
         else:
             print(f"Auth Failed: {profile.status_code} - {profile.text}")
@@ -15,9 +15,15 @@ Usage:
 """
 
 import requests
+import io
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
@@ -32,30 +38,87 @@ if not API_KEY:
 
 headers = {"x-api-key": API_KEY, "Content-Type": "application/json"}
 
-# Test results tracking
-tests_passed = 0
-tests_failed = 0
+TIMEOUT = 10  # seconds per request
+
+# Independent tests run side by side, one pooled connection per worker.
+# HTTP/2 could multiplex them over one connection, but that needs httpx;
+# at this width the extra HTTP/1.1 handshakes are paid once per run.
+MAX_WORKERS = 8
+
+# Every test goes through one keep-alive session, so the suite reuses
+# its pooled connections instead of opening one per request. Gateway errors
+# (502/503/504), e.g. from a Lambda cold start, are retried with a short
+# backoff for idempotent requests. The suite's PATCHes set fixed values, so
+# they are safe to resend too; POSTs are not, since a retry
+# could leave duplicate test contacts behind. The expected 401/404 responses
+# of the error handling tests are not in the list, so they are never retried.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE", "PATCH"]),
+    raise_on_status=False
+)
+
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(max_retries=RETRY, pool_connections=1, pool_maxsize=MAX_WORKERS, pool_block=True)
+)
+
+@dataclass
+class TestResult:
+    """Outcome of one test."""
+    name: str
+    ok: bool
+    msg: str = ""
+
+
+# Output and results of the tests running in the current thread, see
+# run_buffered(); each thread only touches its own, so no lock is needed
+_current = threading.local()
+
+
+def emit(line):
+    """Print a line, or add it to the current test's buffer when one is active."""
+    buf = getattr(_current, 'buf', None)
+    if buf is None:
+        print(line)
+    else:
+        buf.write(f"{line}\n")
+
+
+def run_buffered(test, *args):
+    """Run a test with its output buffered; return (result, output, test results)."""
+    _current.buf = io.StringIO()
+    _current.results = []
+    try:
+        result = test(*args)
+        return result, _current.buf.getvalue(), _current.results
+    finally:
+        _current.buf = None
+        _current.results = None
 
 
 def print_test(name):
     """Print test name."""
-    print(f"\n{'='*70}")
-    print(f"TEST: {name}")
-    print(f"{'='*70}")
+    _current.name = name
+    emit(f"\n{'='*70}")
+    emit(f"TEST: {name}")
+    emit(f"{'='*70}")
 
 
 def pass_test(message=""):
     """Mark test as passed."""
-    global tests_passed
-    tests_passed += 1
-    print(f"✅ PASSED {f'- {message}' if message else ''}")
+    _current.results.append(TestResult(_current.name, True, message))
+    emit(f"✅ PASSED {f'- {message}' if message else ''}")
 
 
 def fail_test(message=""):
     """Mark test as failed."""
-    global tests_failed
-    tests_failed += 1
-    print(f"❌ FAILED {f'- {message}' if message else ''}")
+    _current.results.append(TestResult(_current.name, False, message))
+    emit(f"❌ FAILED {f'- {message}' if message else ''}")
 
 
 def test_health_check():
@@ -63,7 +126,12 @@ def test_health_check():
     print_test("Health Check (No Auth)")
 
     try:
-        response = requests.get(f"{BASE_URL}/api/health")
+        # Drop the session's API key: the health check must work without auth
+        response = SESSION.get(
+            f"{BASE_URL}/api/health",
+            headers={"x-api-key": None},
+            timeout=TIMEOUT
+        )
 
         if response.status_code == 200:
             data = response.json()
@@ -83,9 +151,9 @@ def test_user_profile():
     print_test("Get User Profile")
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{BASE_URL}/api/user/profile",
-            headers=headers
+            timeout=TIMEOUT
         )
 
         if response.status_code == 200:
@@ -104,9 +172,9 @@ def test_user_profile():
     return None
 
 
-def test_create_contact():
-    """Test creating a single contact."""
-    print_test("Create Single Contact")
+def test_create_contacts():
+    """Test creating the lifecycle contact and the bulk contacts in one request."""
+    print_test("Create Contacts (Single + Bulk)")
 
     contact = {
         "name": "Test Contact",
@@ -118,30 +186,42 @@ def test_create_contact():
         "notes": "Created by test suite"
     }
 
+    bulk_contacts = [
+        {"name": "Bulk Contact 1", "email": "bulk1@example.com"},
+        {"name": "Bulk Contact 2", "email": "bulk2@example.com"},
+        {"name": "Bulk Contact 3", "email": "bulk3@example.com"}
+    ]
+
+    contacts = [contact] + bulk_contacts
+
     try:
-        response = requests.post(
+        # One bulk POST instead of a single create plus a bulk create;
+        # created[0] is the lifecycle contact, the rest are the bulk set
+        response = SESSION.post(
             f"{BASE_URL}/api/contacts",
-            headers=headers,
-            json=contact
+            json=contacts,
+            timeout=TIMEOUT
         )
 
         if response.status_code == 201:
             data = response.json()
             created = data.get('created', [])
 
-            if created and created[0].get('name') == contact['name']:
-                contact_id = created[0]['id']
-                pass_test(f"Contact created with ID: {contact_id}")
-                return contact_id
-            else:
+            if len(created) != len(contacts):
+                fail_test(f"Expected {len(contacts)} contacts, created {len(created)}")
+            elif created[0].get('name') != contact['name']:
                 fail_test(f"Unexpected response: {data}")
+            else:
+                contact_id = created[0]['id']
+                pass_test(f"Contact created with ID: {contact_id}, plus {len(created) - 1} in bulk")
+                return contact_id, [c['id'] for c in created[1:]]
         else:
             fail_test(f"Status code {response.status_code}: {response.text}")
 
     except Exception as e:
         fail_test(f"Exception: {e}")
 
-    return None
+    return None, []
 
 
 def test_list_contacts():
@@ -149,9 +229,9 @@ def test_list_contacts():
     print_test("List All Contacts")
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{BASE_URL}/api/contacts",
-            headers=headers
+            timeout=TIMEOUT
         )
 
         if response.status_code == 200:
@@ -184,10 +264,10 @@ def test_update_contact(contact_id):
     }
 
     try:
-        response = requests.patch(
+        response = SESSION.patch(
             f"{BASE_URL}/api/contacts/{contact_id}",
-            headers=headers,
-            json=updates
+            json=updates,
+            timeout=TIMEOUT
         )
 
         if response.status_code == 200:
@@ -203,41 +283,6 @@ def test_update_contact(contact_id):
         fail_test(f"Exception: {e}")
 
 
-def test_bulk_create_contacts():
-    """Test creating multiple contacts."""
-    print_test("Bulk Create Contacts")
-
-    contacts = [
-        {"name": "Bulk Contact 1", "email": "bulk1@example.com"},
-        {"name": "Bulk Contact 2", "email": "bulk2@example.com"},
-        {"name": "Bulk Contact 3", "email": "bulk3@example.com"}
-    ]
-
-    try:
-        response = requests.post(
-            f"{BASE_URL}/api/contacts",
-            headers=headers,
-            json=contacts
-        )
-
-        if response.status_code == 201:
-            data = response.json()
-            created = data.get('created', [])
-
-            if len(created) == len(contacts):
-                pass_test(f"Created {len(created)} contacts in bulk")
-                return [c['id'] for c in created]
-            else:
-                fail_test(f"Expected {len(contacts)} contacts, created {len(created)}")
-        else:
-            fail_test(f"Status code {response.status_code}: {response.text}")
-
-    except Exception as e:
-        fail_test(f"Exception: {e}")
-
-    return []
-
-
 def test_create_deal(contact_id):
     """Test creating a deal."""
     print_test("Create Deal")
@@ -252,10 +297,10 @@ def test_create_deal(contact_id):
     }
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/deals",
-            headers=headers,
-            json=deal
+            json=deal,
+            timeout=TIMEOUT
         )
 
         if response.status_code == 201:
@@ -282,9 +327,9 @@ def test_list_deals():
     print_test("List All Deals")
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{BASE_URL}/api/deals",
-            headers=headers
+            timeout=TIMEOUT
         )
 
         if response.status_code == 200:
@@ -317,10 +362,10 @@ def test_update_deal(deal_id):
     }
 
     try:
-        response = requests.patch(
+        response = SESSION.patch(
             f"{BASE_URL}/api/deals/{deal_id}",
-            headers=headers,
-            json=updates
+            json=updates,
+            timeout=TIMEOUT
         )
 
         if response.status_code == 200:
@@ -345,9 +390,9 @@ def test_delete_deal(deal_id):
         return
 
     try:
-        response = requests.delete(
+        response = SESSION.delete(
             f"{BASE_URL}/api/deals/{deal_id}",
-            headers=headers
+            timeout=TIMEOUT
         )
 
         if response.status_code == 200:
@@ -372,9 +417,9 @@ def test_delete_contact(contact_id):
         return
 
     try:
-        response = requests.delete(
+        response = SESSION.delete(
             f"{BASE_URL}/api/contacts/{contact_id}",
-            headers=headers
+            timeout=TIMEOUT
         )
 
         if response.status_code == 200:
@@ -397,9 +442,11 @@ def test_error_handling():
     bad_headers = {"x-api-key": "invalid_key", "Content-Type": "application/json"}
 
     try:
-        response = requests.get(
+        # Per-request headers override the session's valid key
+        response = SESSION.get(
             f"{BASE_URL}/api/contacts",
-            headers=bad_headers
+            headers=bad_headers,
+            timeout=TIMEOUT
         )
 
         if response.status_code == 401:
@@ -416,9 +463,9 @@ def test_404_handling():
     print_test("Error Handling - 404 Not Found")
 
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{BASE_URL}/api/contacts/nonexistent-id-12345",
-            headers=headers
+            timeout=TIMEOUT
         )
 
         if response.status_code == 404:
@@ -430,50 +477,62 @@ def test_404_handling():
         fail_test(f"Exception: {e}")
 
 
+def test_deal_lifecycle(contact_id):
+    """Create, update and delete a deal for a contact; each step needs the previous one."""
+    deal_id = test_create_deal(contact_id)
+    test_update_deal(deal_id)
+    test_delete_deal(deal_id)
+
+
 def run_all_tests():
     """Run complete test suite."""
     print("\n" + "="*70)
     print("ZERO CRM API - COMPREHENSIVE TEST SUITE")
     print("="*70)
 
-    # Test 1: Health check
-    test_health_check()
-
-    # Test 2: User profile
-    test_user_profile()
-
-    # Test 3: Create contact
-    contact_id = test_create_contact()
-
-    # Test 4: List contacts
-    test_list_contacts()
-
-    # Test 5: Update contact
-    test_update_contact(contact_id)
-
-    # Test 6: Bulk create contacts
-    bulk_contact_ids = test_bulk_create_contacts()
-
-    # Test 7: Create deal
-    deal_id = test_create_deal(contact_id)
-
-    # Test 8: List deals
-    test_list_deals()
-
-    # Test 9: Update deal
-    test_update_deal(deal_id)
-
-    # Test 10: Delete deal
-    test_delete_deal(deal_id)
-
-    # Test 11: Delete contacts
-    test_delete_contact(contact_id)
-    for bulk_id in bulk_contact_ids:
-        test_delete_contact(bulk_id)
-
-    # Test 12: Error handling
-    test_error_handling()
-    test_404_handling()
+    # Tests that don't depend on each other run concurrently, next to the
+    # create -> update -> delete chains. Each test's output is buffered and printed
+    # in this order once it finishes, so it never interleaves.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        create_future = executor.submit(run_buffered, test_create_contacts)
+        futures = [
+            executor.submit(run_buffered, test_health_check),
+            executor.submit(run_buffered, test_user_profile),
+            executor.submit(run_buffered, test_list_contacts),
+            executor.submit(run_buffered, test_list_deals),
+            executor.submit(run_buffered, test_error_handling),
+            executor.submit(run_buffered, test_404_handling),
+            create_future
+        ]
+
+        # Everything else needs the created contacts. The contact update
+        # only needs the ID, just like the deal, so it runs alongside the
+        # deal's chain and the bulk deletes instead of in front of them
+        (contact_id, bulk_contact_ids), _, _ = create_future.result()
+        contact_futures = [
+            executor.submit(run_buffered, test_update_contact, contact_id),
+            executor.submit(run_buffered, test_deal_lifecycle, contact_id)
+        ]
+        futures += contact_futures
+        futures += [
+            executor.submit(run_buffered, test_delete_contact, bulk_id)
+            for bulk_id in bulk_contact_ids
+        ]
+
+        # The contact goes last, once its update and deal are done with it
+        wait(contact_futures)
+        futures.append(executor.submit(run_buffered, test_delete_contact, contact_id))
+
+        # One write per test rather than one print() per line
+        results = []
+        for future in futures:
+            _, output, test_results = future.result()
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            results += test_results
+
+    tests_passed = sum(r.ok for r in results)
+    tests_failed = len(results) - tests_passed
 
     # Print summary
     print("\n" + "="*70)
@@ -502,6 +561,8 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        SESSION.close()
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@
 Verification Script for Zero CRM Skill Installation
 
 Checks:
-- Python version
+- Python version (3.7+, checked on startup)
 - Required dependencies
 - API key configuration
 - API connectivity
@@ -15,31 +15,111 @@ Usage:
 
 import sys
 import os
+import json
+import re
 import subprocess
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# Fail fast on interpreters the script (and the skill) doesn't support
+MIN_PY = (3, 7)
+if sys.version_info < MIN_PY:
+    sys.exit(f"❌ Python {MIN_PY[0]}.{MIN_PY[1]}+ required, have {sys.version.split()[0]}")
+
+try:
+    import orjson  # Optional: faster JSON decoding
+except ImportError:
+    orjson = None
+
+try:
+    from importlib.metadata import version as metadata_version, PackageNotFoundError
+except ImportError:  # Python < 3.8: fall back to importing the package
+    metadata_version = None
+
+try:
+    from packaging.version import Version, InvalidVersion
+except ImportError:  # packaging is optional; compare release numbers instead
+    Version = None
+
+# Import names for distributions whose module is named differently
+IMPORT_NAMES = {'python-dotenv': 'dotenv'}
+
+# Load .env once for every check (skipped when the key is already exported;
+# a missing python-dotenv is reported by check_dependencies)
+if not os.environ.get("ZERO_CRM_API_KEY"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+API_KEY = os.getenv("ZERO_CRM_API_KEY")
+BASE_URL = "https://vbrsrhfxfv6qk2jbrraym2a2du0qlazt.lambda-url.us-east-1.on.aws"
+
+
+# Each check's output is buffered per thread so the checks can run
+# concurrently and still print in their canonical order
+_output = threading.local()
+
+
+def emit(line=""):
+    """Print a line, or add it to the current check's buffer when one is active."""
+    lines = getattr(_output, 'lines', None)
+    if lines is None:
+        print(line)
+    else:
+        lines.append(line)
+
+
+def run_buffered(check):
+    """Run a check with its output buffered; return (result, output)."""
+    _output.lines = []
+    try:
+        result = check()
+        return result, "\n".join(_output.lines)
+    finally:
+        _output.lines = None
 
 
 def print_section(title):
     """Print a formatted section header."""
-    print(f"\n{'='*70}")
-    print(f"  {title}")
-    print(f"{'='*70}\n")
+    emit(f"\n{'='*70}")
+    emit(f"  {title}")
+    emit(f"{'='*70}\n")
 
 
-def check_python_version():
-    """Check Python version."""
-    print_section("Checking Python Version")
+def get_installed_version(package):
+    """Return a distribution's installed version, or None if it is missing."""
+    if metadata_version is not None:
+        # Reads the installed metadata only; the package itself is not imported
+        try:
+            return metadata_version(package)
+        except PackageNotFoundError:
+            return None
 
-    version = sys.version_info
-    version_str = f"{version.major}.{version.minor}.{version.micro}"
+    try:
+        module = __import__(IMPORT_NAMES.get(package, package))
+    except ImportError:
+        return None
+    return getattr(module, '__version__', 'unknown')
 
-    print(f"Python version: {version_str}")
 
-    if version.major >= 3 and version.minor >= 6:
-        print("✅ Python version is compatible (3.6+)")
-        return True
-    else:
-        print("❌ Python 3.6+ required")
-        return False
+def parse_version(version):
+    """Make a version string comparable, e.g. '2.28.1' -> (2, 28, 1), or None if it isn't one."""
+    if Version is not None:
+        try:
+            return Version(version)
+        except InvalidVersion:
+            return None
+
+    release = re.match(r"\d+(?:\.\d+)*", version)
+    if not release:
+        return None
+    parts = [int(part) for part in release.group().split(".")]
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()  # So '2.28' and '2.28.0' compare equal
+    return tuple(parts)
 
 
 def check_dependencies():
@@ -48,31 +128,31 @@ def check_dependencies():
 
     required_packages = {
         'requests': '2.28.0',
+        'urllib3': '1.26.0',
         'python-dotenv': '0.19.0'
     }
 
     all_installed = True
 
     for package, min_version in required_packages.items():
-        try:
-            if package == 'python-dotenv':
-                import dotenv
-                module_name = 'dotenv'
-            else:
-                module_name = package
+        installed_version = get_installed_version(package)
 
-            module = __import__(module_name)
-            installed_version = getattr(module, '__version__', 'unknown')
-
-            print(f"✅ {package}: {installed_version} (required: {min_version}+)")
+        if installed_version is None:
+            emit(f"❌ {package}: NOT INSTALLED (required: {min_version}+)")
+            all_installed = False
+            continue
 
-        except ImportError:
-            print(f"❌ {package}: NOT INSTALLED (required: {min_version}+)")
+        # Versions that can't be parsed ('unknown', non-PEP 440) aren't compared
+        installed = parse_version(installed_version)
+        if installed is not None and installed < parse_version(min_version):
+            emit(f"❌ {package}: {installed_version} is too old (required: {min_version}+)")
             all_installed = False
+        else:
+            emit(f"✅ {package}: {installed_version} (required: {min_version}+)")
 
     if not all_installed:
-        print("\n💡 Install missing dependencies:")
-        print("   pip install -r requirements.txt")
+        emit("\n💡 Install missing or outdated dependencies:")
+        emit("   pip install -r requirements.txt")
 
     return all_installed
 
@@ -81,56 +161,55 @@ def check_api_key():
     """Check API key configuration."""
     print_section("Checking API Key Configuration")
 
-    from dotenv import load_dotenv
-    load_dotenv()
-
-    api_key = os.getenv("ZERO_CRM_API_KEY")
+    api_key = API_KEY
 
     if not api_key:
-        print("❌ ZERO_CRM_API_KEY not found in environment")
-        print("\n💡 Set your API key:")
-        print("   echo 'ZERO_CRM_API_KEY=zero_your_key_here' > .env")
+        emit("❌ ZERO_CRM_API_KEY not found in environment")
+        emit("\n💡 Set your API key:")
+        emit("   echo 'ZERO_CRM_API_KEY=zero_your_key_here' > .env")
         return False
 
     if not api_key.startswith("zero_"):
-        print(f"⚠️  API key format unexpected: {api_key[:10]}...")
-        print("   Expected format: zero_<hash>")
+        emit(f"⚠️  API key format unexpected: {api_key[:10]}...")
+        emit("   Expected format: zero_<hash>")
         return False
 
-    print(f"✅ API key found: {api_key[:10]}...{api_key[-5:]}")
+    emit(f"✅ API key found: {api_key[:10]}...{api_key[-5:]}")
     return True
 
 
-def check_api_connectivity():
+def check_api_connectivity(api_key=API_KEY):
     """Test API connectivity."""
     print_section("Checking API Connectivity")
 
+    session = None
+
     try:
         import requests
-        from dotenv import load_dotenv
+        from requests.adapters import HTTPAdapter
 
-        load_dotenv()
-
-        BASE_URL = "https://vbrsrhfxfv6qk2jbrraym2a2du0qlazt.lambda-url.us-east-1.on.aws"
+        # Both probes hit the same host, so one keep-alive connection
+        # means a single DNS lookup and TLS handshake for the pair
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
 
         # Test health endpoint (no auth)
-        print("Testing health endpoint...")
-        response = requests.get(f"{BASE_URL}/api/health", timeout=10)
+        emit("Testing health endpoint...")
+        response = session.get(f"{BASE_URL}/api/health", timeout=10)
 
         if response.status_code == 200:
             data = response.json()
-            print(f"✅ Health check successful: {data}")
+            emit(f"✅ Health check successful: {data}")
         else:
-            print(f"❌ Health check failed: {response.status_code}")
+            emit(f"❌ Health check failed: {response.status_code}")
             return False
 
         # Test authenticated endpoint
-        api_key = os.getenv("ZERO_CRM_API_KEY")
         if api_key:
-            print("\nTesting authenticated endpoint...")
+            emit("\nTesting authenticated endpoint...")
             headers = {"x-api-key": api_key}
 
-            response = requests.get(
+            response = session.get(
                 f"{BASE_URL}/api/user/profile",
                 headers=headers,
                 timeout=10
@@ -138,34 +217,38 @@ def check_api_connectivity():
 
             if response.status_code == 200:
                 data = response.json()
-                print(f"✅ Authentication successful")
-                print(f"   User: {data.get('email', 'N/A')}")
+                emit(f"✅ Authentication successful")
+                emit(f"   User: {data.get('email', 'N/A')}")
                 return True
             elif response.status_code == 401:
-                print(f"❌ Authentication failed: Invalid API key")
+                emit(f"❌ Authentication failed: Invalid API key")
                 return False
             else:
-                print(f"❌ API error: {response.status_code}")
+                emit(f"❌ API error: {response.status_code}")
                 return False
 
         return True
 
     except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+        emit(f"❌ Missing dependency: {e}")
         return False
 
     except requests.exceptions.ConnectionError:
-        print(f"❌ Connection error: Cannot reach API")
+        emit(f"❌ Connection error: Cannot reach API")
         return False
 
     except requests.exceptions.Timeout:
-        print(f"❌ Request timeout: API not responding")
+        emit(f"❌ Request timeout: API not responding")
         return False
 
     except Exception as e:
-        print(f"❌ Error: {e}")
+        emit(f"❌ Error: {e}")
         return False
 
+    finally:
+        if session is not None:
+            session.close()
+
 
 def check_skill_files():
     """Check that all required skill files exist."""
@@ -185,14 +268,31 @@ def check_skill_files():
         "examples/error_handling.py"
     ]
 
+    # Group the expected names by directory and list each directory once,
+    # so every file costs a single stat instead of exists() + getsize()
+    buckets = defaultdict(set)
+    for file_path in required_files:
+        directory, name = os.path.split(file_path)
+        buckets[directory].add(name)
+
+    sizes = {}
+    for directory, names in buckets.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        sizes[os.path.join(directory, entry.name)] = entry.stat().st_size
+        except OSError:
+            pass  # Missing directory: its files are reported below
+
     all_exist = True
 
     for file_path in required_files:
-        if os.path.exists(file_path):
-            size = os.path.getsize(file_path)
-            print(f"✅ {file_path:<40} ({size:>6} bytes)")
+        size = sizes.get(file_path)
+        if size is not None:
+            emit(f"✅ {file_path:<40} ({size:>6} bytes)")
         else:
-            print(f"❌ {file_path:<40} MISSING")
+            emit(f"❌ {file_path:<40} MISSING")
             all_exist = False
 
     return all_exist
@@ -203,28 +303,27 @@ def check_npm_package():
     print_section("Checking npm Package")
 
     if not os.path.exists("package.json"):
-        print("❌ package.json not found")
+        emit("❌ package.json not found")
         return False
 
     try:
-        import json
-
-        with open("package.json", "r") as f:
-            package = json.load(f)
+        with open("package.json", "rb") as f:
+            raw = f.read()
+        package = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-        print(f"Package name: {package.get('name', 'N/A')}")
-        print(f"Version:      {package.get('version', 'N/A')}")
-        print(f"Description:  {package.get('description', 'N/A')}")
+        emit(f"Package name: {package.get('name', 'N/A')}")
+        emit(f"Version:      {package.get('version', 'N/A')}")
+        emit(f"Description:  {package.get('description', 'N/A')}")
 
         if 'bin' in package:
-            print(f"✅ CLI binaries configured: {list(package['bin'].keys())}")
+            emit(f"✅ CLI binaries configured: {list(package['bin'].keys())}")
         else:
-            print(f"⚠️  No CLI binaries configured")
+            emit(f"⚠️  No CLI binaries configured")
 
         return True
 
     except Exception as e:
-        print(f"❌ Error reading package.json: {e}")
+        emit(f"❌ Error reading package.json: {e}")
         return False
 
 
@@ -234,15 +333,24 @@ def run_verification():
     print("ZERO CRM SKILL - INSTALLATION VERIFICATION")
     print("="*70)
 
-    results = {
-        "Python Version": check_python_version(),
-        "Dependencies": check_dependencies(),
-        "API Key": check_api_key(),
-        "API Connectivity": check_api_connectivity(),
-        "Skill Files": check_skill_files(),
-        "npm Package": check_npm_package()
+    checks = {
+        "Dependencies": check_dependencies,
+        "API Key": check_api_key,
+        "API Connectivity": check_api_connectivity,
+        "Skill Files": check_skill_files,
+        "npm Package": check_npm_package
     }
 
+    # Only the connectivity check waits on the network, so the local
+    # checks run alongside it instead of after it
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {name: executor.submit(run_buffered, check) for name, check in checks.items()}
+
+    results = {}
+    for name, future in futures.items():
+        results[name], output = future.result()
+        print(output)
+
     # Summary
     print_section("Verification Summary")
 